@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 """Fast-Clip Script Checker: Validate Shotstack-compatible JSON scripts."""
 
-import json
+import contextlib
+import functools
+import io
 import sys
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
+from fast_clip._json import JSONDecodeError, parse_file
 from fast_clip.check.validation import (
     JsonValidator,
     FileChecker,
@@ -16,6 +19,115 @@ from fast_clip.check.validation import (
 )
 
 
+@functools.cache
+def _shared_validators(strict_mode: bool) -> Tuple[JsonValidator, FieldValidator]:
+    """Return the stateless JSON and field validators for a strictness level.
+
+    FileChecker keeps per-script path caches, so it is still built per call.
+    """
+    return (
+        JsonValidator(strict_mode=strict_mode),
+        FieldValidator(strict_mode=strict_mode),
+    )
+
+
+def _run_validators(
+    data: dict,
+    json_validator: JsonValidator,
+    file_checker: FileChecker,
+    field_validator: FieldValidator,
+    quiet: bool,
+) -> List[ValidationReport]:
+    """Run validators in order and return their reports.
+
+    data must come straight from parse_file: it is then known to be JSON
+    serializable, so the JSON validator skips its json.dumps round-trip.
+
+    Validation stops once a report is fatal. Quiet callers only need the
+    verdict, so they also stop after the first validator that reports an
+    error.
+    """
+    checks = (
+        functools.partial(json_validator.validate, from_parser=True),
+        file_checker.validate,
+        field_validator.validate,
+    )
+    reports = []
+    for check in checks:
+        report = check(data)
+        reports.append(report)
+        if report.fatal or (quiet and report.total_errors):
+            break
+    return reports
+
+
+# Legacy results carry a status string; anything not listed is "OK"/INFO
+_LEVEL_TO_STATUS = {ValidationLevel.ERROR: "ERROR", ValidationLevel.WARNING: "WARNING"}
+_STATUS_TO_LEVEL = {"ERROR": ValidationLevel.ERROR, "WARNING": ValidationLevel.WARNING}
+
+
+def _legacy_results(reports: List[ValidationReport]) -> list:
+    """Convert validation reports to legacy result dicts."""
+    level_to_status = _LEVEL_TO_STATUS.get
+    return [
+        {
+            "field": result.field or "unknown",
+            "status": level_to_status(result.level, "OK"),
+            "message": result.message,
+            "suggestion": result.suggestion,
+        }
+        for report in reports
+        for result in report.results
+    ]
+
+
+def _group_by_status(results: list) -> Dict[str, list]:
+    """Split legacy result dicts into ERROR, WARNING and OK lists in one pass."""
+    groups: Dict[str, list] = {"ERROR": [], "WARNING": [], "OK": []}
+    for r in results:
+        group = groups.get(r["status"])
+        if group is not None:
+            group.append(r)
+    return groups
+
+
+def _append_issues(out: List[str], errors: list, warnings: list):
+    """Append the ERRORS and WARNINGS sections of a report to out.
+
+    Reports are collected as lines and written with one stdout write.
+    """
+    if errors:
+        out.append(f"\n❌ ERRORS ({len(errors)}):")
+        for r in errors:
+            out.append(f"  ✗ {r['field']}: {r['message']}")
+            if r.get("suggestion"):
+                out.append(f"    → {r['suggestion']}")
+
+    if warnings:
+        out.append(f"\n⚠️  WARNINGS ({len(warnings)}):")
+        for r in warnings:
+            out.append(f"  ! {r['field']}: {r['message']}")
+            if r.get("suggestion"):
+                out.append(f"    → {r['suggestion']}")
+
+
+def _write_report(script_path: Path, errors: list, warnings: list):
+    """Write the report check_script prints for one script."""
+    out = [f"\n{'=' * 60}", f"Script: {script_path}", f"{'=' * 60}"]
+    _append_issues(out, errors, warnings)
+
+    out.append(f"\n{'=' * 60}")
+    if errors:
+        out.append("RESULT: ❌ FAILED (fix errors before proceeding)")
+    elif warnings:
+        out.append("RESULT: ⚠️  PASSED WITH WARNINGS")
+    else:
+        out.append("RESULT: ✓ ALL CHECKS PASSED")
+    out.append(f"{'=' * 60}\n")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
 # Legacy support - keep the old interface
 class ScriptChecker:
     """Legacy ScriptChecker for backward compatibility."""
@@ -46,13 +158,7 @@ class ScriptChecker:
     ):
         """Add check result and update error/warning flags."""
         # Convert legacy format to new ValidationResult
-        level = (
-            ValidationLevel.ERROR
-            if status == "ERROR"
-            else (
-                ValidationLevel.WARNING if status == "WARNING" else ValidationLevel.INFO
-            )
-        )
+        level = _STATUS_TO_LEVEL.get(status, ValidationLevel.INFO)
 
         validation_result = ValidationResult(
             status=status,
@@ -82,11 +188,10 @@ class ScriptChecker:
             return False
 
         try:
-            with open(self.script_path, "r", encoding="utf-8") as f:
-                self.data = json.load(f)
+            self.data = parse_file(self.script_path)
             self.add_result("file", "OK", "JSON loaded successfully")
             return True
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             self.add_result("file", "ERROR", f"Invalid JSON: {e}")
             return False
         except Exception as e:
@@ -99,38 +204,20 @@ class ScriptChecker:
             return False, self.results
 
         # Run comprehensive validation using new modules
-        json_report = self.json_validator.validate(self.data)
-        file_report = self.file_checker.validate(self.data)
-        field_report = self.field_validator.validate(self.data)
+        reports = _run_validators(
+            self.data,
+            self.json_validator,
+            self.file_checker,
+            self.field_validator,
+            self.quiet,
+        )
 
         # Convert all validation results to legacy format
-        all_results = []
-        for report in [json_report, file_report, field_report]:
-            for result in report.results:
-                # Convert ValidationResult to legacy CheckResult format
-                status = (
-                    "ERROR"
-                    if result.level == ValidationLevel.ERROR
-                    else (
-                        "WARNING" if result.level == ValidationLevel.WARNING else "OK"
-                    )
-                )
+        self.results = _legacy_results(reports)
 
-                legacy_result = {
-                    "field": result.field or "unknown",
-                    "status": status,
-                    "message": result.message,
-                    "suggestion": result.suggestion,
-                }
-                all_results.append(legacy_result)
-
-                # Update legacy flags
-                if status == "ERROR":
-                    self.has_errors = True
-                elif status == "WARNING":
-                    self.has_warnings = True
-
-        self.results = all_results
+        # Update legacy flags from the counts the reports already keep
+        self.has_errors = self.has_errors or any(r.total_errors for r in reports)
+        self.has_warnings = self.has_warnings or any(r.total_warnings for r in reports)
         return not self.has_errors, self.results
 
     def print_report(self):
@@ -139,44 +226,30 @@ class ScriptChecker:
         if self.quiet:
             return
 
-        print(f"\n{'=' * 60}")
-        print(f"Script: {self.script_path}")
-        print(f"{'=' * 60}")
-
         # Group by status
-        errors = [r for r in self.results if r["status"] == "ERROR"]
-        warnings = [r for r in self.results if r["status"] == "WARNING"]
-        ok = [r for r in self.results if r["status"] == "OK"]
-
-        if errors:
-            print(f"\n❌ ERRORS ({len(errors)}):")
-            for r in errors:
-                print(f"  ✗ {r['field']}: {r['message']}")
-                if r.get("suggestion"):
-                    print(f"    → {r['suggestion']}")
-
-        if warnings:
-            print(f"\n⚠️  WARNINGS ({len(warnings)}):")
-            for r in warnings:
-                print(f"  ! {r['field']}: {r['message']}")
-                if r.get("suggestion"):
-                    print(f"    → {r['suggestion']}")
+        groups = _group_by_status(self.results)
+        errors, warnings, ok = groups["ERROR"], groups["WARNING"], groups["OK"]
+
+        out = [f"\n{'=' * 60}", f"Script: {self.script_path}", f"{'=' * 60}"]
+        _append_issues(out, errors, warnings)
 
         if self.verbose and ok:
-            print(f"\n✓ OK ({len(ok)}):")
+            out.append(f"\n✓ OK ({len(ok)}):")
             for r in ok[:10]:  # Limit OK messages
-                print(f"  ✓ {r['field']}: {r['message']}")
+                out.append(f"  ✓ {r['field']}: {r['message']}")
             if len(ok) > 10:
-                print(f"  ... and {len(ok) - 10} more")
+                out.append(f"  ... and {len(ok) - 10} more")
 
-        print(f"\n{'=' * 60}")
+        out.append(f"\n{'=' * 60}")
         if self.has_errors:
-            print("RESULT: ❌ FAILED (fix errors before proceeding)")
+            out.append("RESULT: ❌ FAILED (fix errors before proceeding)")
         elif self.has_warnings:
-            print("RESULT: ⚠️  PASSED WITH WARNINGS")
+            out.append("RESULT: ⚠️  PASSED WITH WARNINGS")
         else:
-            print("RESULT: ✓ ALL CHECKS PASSED")
-        print(f"{'=' * 60}\n")
+            out.append("RESULT: ✓ ALL CHECKS PASSED")
+        out.append(f"{'=' * 60}\n")
+
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 def check_script(
@@ -194,96 +267,86 @@ def check_script(
             checker.add_result("validation", "OK", "Validation skipped by user request")
             return True, checker.results
         else:
+            if not quiet:
+                groups = _group_by_status(
+                    _legacy_results([ValidationReport.from_results(checker.results)])
+                )
+                _write_report(script_path, groups["ERROR"], groups["WARNING"])
             return False, checker.results
 
     # Initialize validators with appropriate settings
-    json_validator = JsonValidator(strict_mode=strict_mode)
+    json_validator, field_validator = _shared_validators(strict_mode)
     file_checker = FileChecker(strict_mode=strict_mode, script_path=script_path)
-    field_validator = FieldValidator(strict_mode=strict_mode)
 
     # Load JSON
+    load_error: Optional[Dict[str, str]] = None
     try:
-        with open(script_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = parse_file(script_path)
     except FileNotFoundError:
-        return False, [
-            {
-                "field": "file",
-                "status": "ERROR",
-                "message": f"File not found: {script_path}",
-                "suggestion": "Check file path and try again",
-            }
-        ]
-    except json.JSONDecodeError as e:
-        return False, [
-            {
-                "field": "file",
-                "status": "ERROR",
-                "message": f"Invalid JSON: {e}",
-                "suggestion": "Fix JSON syntax errors",
-            }
-        ]
+        load_error = {
+            "field": "file",
+            "status": "ERROR",
+            "message": f"File not found: {script_path}",
+            "suggestion": "Check file path and try again",
+        }
+    except JSONDecodeError as e:
+        load_error = {
+            "field": "file",
+            "status": "ERROR",
+            "message": f"Invalid JSON: {e}",
+            "suggestion": "Fix JSON syntax errors",
+        }
+    except (OSError, UnicodeDecodeError) as e:
+        # The file is parsed from raw bytes, so bad UTF-8 surfaces here
+        # with the stdlib backend instead of at open()
+        load_error = {
+            "field": "file",
+            "status": "ERROR",
+            "message": f"Failed to read file: {e}",
+            "suggestion": "Check file permissions and encoding",
+        }
+
+    # Report scripts that could not be loaded, so a batch shows which
+    # script failed
+    if load_error is not None:
+        if not quiet:
+            _write_report(script_path, [load_error], [])
+        return False, [load_error]
 
     # Run validation
-    json_report = json_validator.validate(data)
-    file_report = file_checker.validate(data)
-    field_report = field_validator.validate(data)
+    reports = _run_validators(
+        data, json_validator, file_checker, field_validator, quiet
+    )
 
     # Combine results
-    all_results = []
-    for report in [json_report, file_report, field_report]:
-        for result in report.results:
-            status = (
-                "ERROR"
-                if result.level == ValidationLevel.ERROR
-                else ("WARNING" if result.level == ValidationLevel.WARNING else "OK")
-            )
+    all_results = _legacy_results(reports)
 
-            all_results.append(
-                {
-                    "field": result.field or "unknown",
-                    "status": status,
-                    "message": result.message,
-                    "suggestion": result.suggestion,
-                }
-            )
+    groups = _group_by_status(all_results)
+    errors, warnings = groups["ERROR"], groups["WARNING"]
 
     # Report results
     if not quiet:
-        print(f"\n{'=' * 60}")
-        print(f"Script: {script_path}")
-        print(f"{'=' * 60}")
-
-        errors = [r for r in all_results if r["status"] == "ERROR"]
-        warnings = [r for r in all_results if r["status"] == "WARNING"]
-
-        if errors:
-            print(f"\n❌ ERRORS ({len(errors)}):")
-            for r in errors:
-                print(f"  ✗ {r['field']}: {r['message']}")
-                if r.get("suggestion"):
-                    print(f"    → {r['suggestion']}")
-
-        if warnings:
-            print(f"\n⚠️  WARNINGS ({len(warnings)}):")
-            for r in warnings:
-                print(f"  ! {r['field']}: {r['message']}")
-                if r.get("suggestion"):
-                    print(f"    → {r['suggestion']}")
-
-        print(f"\n{'=' * 60}")
-        if errors:
-            print("RESULT: ❌ FAILED (fix errors before proceeding)")
-        elif warnings:
-            print("RESULT: ⚠️  PASSED WITH WARNINGS")
-        else:
-            print("RESULT: ✓ ALL CHECKS PASSED")
-        print(f"{'=' * 60}\n")
+        _write_report(script_path, errors, warnings)
 
-    errors = [r for r in all_results if r["status"] == "ERROR"]
     return len(errors) == 0, all_results
 
 
+def _check_captured(
+    script_path: Path, quiet: bool, skip_validate: bool, strict_mode: bool
+) -> Tuple[bool, str]:
+    """Check one script in a worker process.
+
+    Returns the verdict and the report check_script printed, so the parent
+    can write reports in argument order. Results stay in the worker.
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        is_valid, _ = check_script(
+            script_path, False, quiet, skip_validate, strict_mode
+        )
+    return is_valid, buffer.getvalue()
+
+
 def main():
     """Main entry point."""
     args = sys.argv[1:]
@@ -291,7 +354,7 @@ def main():
     if not args or args[0] in ("-h", "--help"):
         print("Fast-Clip Script Checker")
         print("")
-        print("Usage: python check.py [options] <script.json>")
+        print("Usage: python check.py [options] <script.json> [...]")
         print("")
         print("Options:")
         print("  -v, --verbose    Show detailed output")
@@ -305,6 +368,7 @@ def main():
         print("  python check.py -v script.json")
         print("  python check.py --strict script.json")
         print("  python check.py --skip-validate script.json")
+        print("  python check.py scripts/*.json")
         sys.exit(0)
 
     # Parse flags
@@ -313,7 +377,7 @@ def main():
     skip_validate = "--skip-validate" in args
     strict_mode = "--strict" in args
 
-    # Remove flags from args to get script path
+    # Remove flags from args to get script paths
     args = [
         a
         for a in args
@@ -324,14 +388,35 @@ def main():
         print("Error: No script file specified")
         sys.exit(1)
 
-    script_path = Path(args[0])
+    script_paths = [Path(a) for a in args]
 
     # Quiet mode overrides verbose
     if quiet:
         verbose = False
 
-    is_valid, _ = check_script(script_path, verbose, quiet, skip_validate, strict_mode)
-    sys.exit(0 if is_valid else 1)
+    if len(script_paths) > 1 and not verbose:
+        from fast_clip.check import check_scripts_parallel
+
+        check = functools.partial(
+            _check_captured,
+            quiet=quiet,
+            skip_validate=skip_validate,
+            strict_mode=strict_mode,
+        )
+        outcomes = check_scripts_parallel(check, script_paths)
+
+        all_valid = True
+        for is_valid, report in outcomes:
+            sys.stdout.write(report)
+            all_valid = all_valid and is_valid
+    else:
+        verdicts = [
+            check_script(path, verbose, quiet, skip_validate, strict_mode)[0]
+            for path in script_paths
+        ]
+        all_valid = all(verdicts)
+
+    sys.exit(0 if all_valid else 1)
 
 
 if __name__ == "__main__":
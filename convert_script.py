@@ -7,6 +7,7 @@ import sys
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+from fast_clip._json import dumps
 from fast_clip.check.validation import (
     JsonValidator,
     FileChecker,
@@ -32,54 +33,62 @@ def log_normal(message: str):
 
 
 # Valid Shotstack values
-VALID_TRANSITIONS = {
-    "fade",
-    "fadefast",
-    "fadeslow",
-    "slideleft",
-    "slideright",
-    "slideup",
-    "slidedown",
-    "slideleftfast",
-    "sliderightfast",
-    "slideupfast",
-    "slidedownfast",
-    "wipeleft",
-    "wiperight",
-    "wipeleftfast",
-    "wiperightfast",
-    "carouselleft",
-    "carouselright",
-    "carouselupfast",
-    "shuffletopright",
-    "shuffleleftbottom",
-    "reveal",
-    "revealfast",
-    "revealslow",
-    "zoom",
-    "zoomfast",
-    "zoomslow",
-}
-VALID_EFFECTS = {"zoomin", "zoomout", "kenburns"}
-VALID_FILTERS = {
-    "boost",
-    "greyscale",
-    "contrast",
-    "muted",
-    "negative",
-    "darken",
-    "lighten",
-}
-VALID_ASPECT_RATIOS = {"9:16", "16:9", "1:1", "4:5", "4:3"}
+VALID_TRANSITIONS = frozenset(
+    {
+        "fade",
+        "fadefast",
+        "fadeslow",
+        "slideleft",
+        "slideright",
+        "slideup",
+        "slidedown",
+        "slideleftfast",
+        "sliderightfast",
+        "slideupfast",
+        "slidedownfast",
+        "wipeleft",
+        "wiperight",
+        "wipeleftfast",
+        "wiperightfast",
+        "carouselleft",
+        "carouselright",
+        "carouselupfast",
+        "shuffletopright",
+        "shuffleleftbottom",
+        "reveal",
+        "revealfast",
+        "revealslow",
+        "zoom",
+        "zoomfast",
+        "zoomslow",
+    }
+)
+VALID_EFFECTS = frozenset({"zoomin", "zoomout", "kenburns"})
+VALID_FILTERS = frozenset(
+    {
+        "boost",
+        "greyscale",
+        "contrast",
+        "muted",
+        "negative",
+        "darken",
+        "lighten",
+    }
+)
+VALID_ASPECT_RATIOS = frozenset({"9:16", "16:9", "1:1", "4:5", "4:3"})
+
+# Resource extensions treated as video (everything else is an image)
+_VIDEO_EXTS = (".mp4", ".avi", ".mov", ".mkv")
 
 
 def parse_duration(duration_str: str) -> float:
-    """Parse duration string to seconds."""
-    duration_str = duration_str.strip().lower()
-    if duration_str.endswith("s"):
+    """Parse duration string to seconds ("3.5", "3.5s" or "500ms")."""
+    duration_str = duration_str.strip()
+    # Slices rather than indexing, so an empty string still fails in float()
+    if duration_str[-1:] in ("s", "S"):
+        if duration_str[-2:-1] in ("m", "M"):
+            return float(duration_str[:-2]) / 1000
         return float(duration_str[:-1])
-    elif duration_str.endswith("ms"):
-        return float(duration_str[:-2]) / 1000
     return float(duration_str)
 
 
@@ -186,18 +195,22 @@ def parse_new_table(
 
 
 def build_output_config(
-    output_format_match, resolution_match, aspect_match, fps_match, thumbnail_match
+    output_format: Optional[str],
+    resolution: Optional[str],
+    aspect: Optional[str],
+    fps: Optional[str],
+    thumbnail: Optional[str],
 ) -> Dict[str, Any]:
-    """Build output configuration with optimized settings for Reels."""
-    output = {
-        "format": output_format_match.group(1).strip()
-        if output_format_match
-        else "mp4",
+    """Build output configuration with optimized settings for Reels.
+
+    Arguments are the stripped header values, or None for absent headers.
+    """
+    output: Dict[str, Any] = {
+        "format": output_format if output_format is not None else "mp4",
         "resolution": "hd",  # Default to HD for better quality
     }
 
-    if resolution_match:
-        resolution = resolution_match.group(1).strip()
+    if resolution is not None:
         # Map common resolutions to Shotstack format
         if resolution in ["480p", "sd"]:
             output["resolution"] = "sd"
@@ -208,8 +221,7 @@ def build_output_config(
         else:
             output["resolution"] = resolution
 
-    if aspect_match:
-        aspect = aspect_match.group(1).strip()
+    if aspect is not None:
         if aspect in VALID_ASPECT_RATIOS:
             output["aspectRatio"] = aspect
         # Default to 9:16 for Reels
@@ -218,8 +230,8 @@ def build_output_config(
         else:
             output["aspectRatio"] = "9:16"  # Reels default
 
-    if fps_match:
-        output["fps"] = int(fps_match.group(1).strip())
+    if fps is not None:
+        output["fps"] = int(fps)
     else:
         output["fps"] = 30  # Default for Reels
 
@@ -269,9 +281,7 @@ def build_clip_with_text(
     duration = parse_duration(duration_str)
 
     # Determine media type
-    media_type = (
-        "video" if clip_file.endswith((".mp4", ".avi", ".mov", ".mkv")) else "image"
-    )
+    media_type = "video" if clip_file.endswith(_VIDEO_EXTS) else "image"
 
     # In script_content.md, clip_file contains just filename (no path)
     # Always add resources_dir for Shotstack format
@@ -387,39 +397,51 @@ def parse_time(time_str: str) -> float:
         )
 
 
+# "## key: value" header lines, all found in one scan of the script
+_HEADER_KEYS = (
+    "name",
+    "resources_dir",
+    "soundtrack",
+    "soundtrack_volume",
+    "background",
+    "output_format",
+    "resolution",
+    "aspect_ratio",
+    "fps",
+    "thumbnail_capture",
+)
+_HEADER_RE = re.compile(rf"##\s*({'|'.join(_HEADER_KEYS)}):\s*(.+)")
+
+
 def md_to_shotstack(md_path: Path) -> dict:
     """Convert markdown script to native Shotstack JSON."""
     log_verbose(f"Reading markdown file: {md_path}")
     content = md_path.read_text(encoding="utf-8")
 
-    # Parse headers
-    name_match = re.search(r"##\s*name:\s*(.+)", content)
-    resources_match = re.search(r"##\s*resources_dir:\s*(.+)", content)
-    soundtrack_match = re.search(r"##\s*soundtrack:\s*(.+)", content)
-    soundtrack_vol_match = re.search(r"##\s*soundtrack_volume:\s*(.+)", content)
-    background_match = re.search(r"##\s*background:\s*(.+)", content)
-    output_format_match = re.search(r"##\s*output_format:\s*(.+)", content)
-    resolution_match = re.search(r"##\s*resolution:\s*(.+)", content)
-    aspect_match = re.search(r"##\s*aspect_ratio:\s*(.+)", content)
-    fps_match = re.search(r"##\s*fps:\s*(.+)", content)
-    thumbnail_match = re.search(r"##\s*thumbnail_capture:\s*(.+)", content)
-
-    if name_match is None or resources_match is None:
+    # Parse headers; the first occurrence of a header wins. Headers sit at
+    # the top, so the scan stops once all of them are found.
+    headers: Dict[str, str] = {}
+    for match in _HEADER_RE.finditer(content):
+        headers.setdefault(match.group(1), match.group(2).strip())
+        if len(headers) == len(_HEADER_KEYS):
+            break
+
+    if "name" not in headers or "resources_dir" not in headers:
         raise ValueError("Missing required headers: name, resources_dir")
 
-    name = name_match.group(1).strip()
-    resources_dir = resources_match.group(1).strip()
+    name = headers["name"]
+    resources_dir = headers["resources_dir"]
     log_verbose(f"Parsed headers: name='{name}', resources_dir='{resources_dir}'")
 
     # Parse soundtrack
     soundtrack: Optional[dict] = None
-    if soundtrack_match:
+    if "soundtrack" in headers:
         soundtrack = {
-            "src": f"{{{{{resources_dir}/{soundtrack_match.group(1).strip()}}}}}",
+            "src": f"{{{{{resources_dir}/{headers['soundtrack']}}}}}",
             "effect": "fadeIn",
         }
-        if soundtrack_vol_match:
-            soundtrack["volume"] = float(soundtrack_vol_match.group(1).strip())
+        if "soundtrack_volume" in headers:
+            soundtrack["volume"] = float(headers["soundtrack_volume"])
 
     # Parse table with new format: Text, Description, Clip, Timing, Duration, Effect, Music effect, Sound effect
     log_verbose("Parsing table rows...")
@@ -447,12 +469,16 @@ def md_to_shotstack(md_path: Path) -> dict:
     timeline: dict = {"tracks": tracks}
     if soundtrack:
         timeline["soundtrack"] = soundtrack
-    if background_match:
-        timeline["background"] = background_match.group(1).strip()
+    if "background" in headers:
+        timeline["background"] = headers["background"]
 
     # Build output with optimized settings for Reels
     output = build_output_config(
-        output_format_match, resolution_match, aspect_match, fps_match, thumbnail_match
+        headers.get("output_format"),
+        headers.get("resolution"),
+        headers.get("aspect_ratio"),
+        headers.get("fps"),
+        headers.get("thumbnail_capture"),
     )
 
     # Generate merge fields for all assets - simple approach
@@ -503,17 +529,17 @@ def build_clip(cells: List[str], resources_dir: str) -> dict:
     resource = cells[1]
     trim_str = cells[2]
     duration_str = cells[3]
-    trans_in = cells[4].lower() if cells[4] else None
-    effect = cells[5].lower() if cells[5] else None
-    filter_name = cells[6].lower() if cells[6] else None
-    trans_out = cells[7].lower() if cells[7] else None
+    # Empty cells become None, which no VALID_* set contains
+    trans_in = cells[4].lower() or None
+    effect = cells[5].lower() or None
+    filter_name = cells[6].lower() or None
+    trans_out = cells[7].lower() or None
     volume_str = cells[8] if len(cells) > 8 else "1.0"
+    is_video = resource.endswith(_VIDEO_EXTS)
 
     clip: dict = {
         "asset": {
-            "type": "video"
-            if resource.endswith((".mp4", ".avi", ".mov", ".mkv"))
-            else "image",
+            "type": "video" if is_video else "image",
             "src": f"{{{resources_dir}/{resource}}}",
         },
         "start": "auto",
@@ -521,7 +547,7 @@ def build_clip(cells: List[str], resources_dir: str) -> dict:
     }
 
     # Add trim for video
-    if resource.endswith((".mp4", ".avi", ".mov", ".mkv")) and trim_str:
+    if is_video and trim_str:
         clip["asset"]["trim"] = parse_time(trim_str)
 
     # Add volume
@@ -530,19 +556,19 @@ def build_clip(cells: List[str], resources_dir: str) -> dict:
 
     # Add transitions
     transition = {}
-    if trans_in and trans_in in VALID_TRANSITIONS:
+    if trans_in in VALID_TRANSITIONS:
         transition["in"] = trans_in
-    if trans_out and trans_out in VALID_TRANSITIONS:
+    if trans_out in VALID_TRANSITIONS:
         transition["out"] = trans_out
     if transition:
         clip["transition"] = transition
 
     # Add effect
-    if effect and effect in VALID_EFFECTS:
+    if effect in VALID_EFFECTS:
         clip["effect"] = effect
 
     # Add filter
-    if filter_name and filter_name in VALID_FILTERS:
+    if filter_name in VALID_FILTERS:
         clip["filter"] = filter_name
 
     return clip
@@ -624,10 +650,7 @@ def convert_file(
 
         log_verbose("✓ Validation passed")
 
-    output_path.write_text(
-        json.dumps(shotstack_data, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    output_path.write_bytes(dumps(shotstack_data))
     log_normal(f"Converted: {input_path} -> {output_path}")
     log_normal(f"Name: {shotstack_data.get('name', 'Unknown')}")
     log_normal(f"Resources: {shotstack_data.get('resourcesDir', 'Unknown')}")
@@ -0,0 +1,114 @@
+"""JSON backend shim: uses orjson when installed, stdlib json otherwise."""
+
+import json
+import mmap
+import os
+import stat
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+JSONDecodeError = json.JSONDecodeError
+
+# orjson reads integers outside the 64-bit range as floats. Those have at
+# least 19 digits, so documents with such a digit run are left to json.loads.
+# Digits are mapped to '0' and everything else to ' ' before searching.
+_DIGIT_MAP = bytes(0x30 if 0x30 <= c <= 0x39 else 0x20 for c in range(256))
+_WIDE_INT_RUN = b"0" * 19
+_SCAN_CHUNK = 1 << 20
+
+
+def _may_hold_wide_int(data: Union[bytes, memoryview]) -> bool:
+    """Return True if data contains a run of 19 or more digits.
+
+    The buffer is scanned in overlapping chunks, so a memory-mapped file is
+    never copied whole.
+    """
+    view = memoryview(data)
+    overlap = len(_WIDE_INT_RUN) - 1
+    for start in range(0, len(view), _SCAN_CHUNK):
+        chunk = view[start : start + _SCAN_CHUNK + overlap].tobytes()
+        if chunk.translate(_DIGIT_MAP).find(_WIDE_INT_RUN) != -1:
+            return True
+    return False
+
+
+def parse(data: Union[bytes, memoryview, str]) -> Any:
+    """Parse a JSON document into plain Python objects.
+
+    orjson is tried first when installed. It is stricter than the stdlib
+    parser (it rejects NaN, Infinity and out-of-range floats, for one), so
+    any document it rejects is handed to json.loads, which decides whether
+    it is valid and reports errors with their line and column. orjson also
+    reads integers outside the 64-bit range as floats, so documents that may
+    contain one go to json.loads directly. Scripts therefore parse to the
+    same values whichever backend is installed.
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if HAS_ORJSON:
+        raw = data.encode("utf-8") if isinstance(data, str) else data
+        if not _may_hold_wide_int(raw):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON.
+
+    orjson is used when installed. Its output matches
+    json.dumps(obj, indent=2, ensure_ascii=False) encoded as UTF-8, with two
+    known differences: floats below 1e-4 are written without an exponent
+    (0.00001 rather than 1e-05, the same value), and NaN and Infinity are
+    written as null. Objects orjson cannot encode, such as integers outside
+    the 64-bit range, are left to json.dumps.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def parse_file(path: Union[str, Path]) -> Any:
+    """Parse a JSON file without copying it into a Python bytes object.
+
+    Regular files are memory-mapped and the mapping is handed to orjson
+    directly. The stdlib parser needs a bytes copy, as do empty files,
+    which cannot be mapped, and pipes, FIFOs and other special files, which
+    are read instead.
+
+    Raises:
+        OSError: If the file cannot be opened
+        JSONDecodeError: If the file is not valid JSON
+    """
+    with open(path, "rb") as f:
+        if not stat.S_ISREG(os.fstat(f.fileno()).st_mode):
+            return parse(f.read())
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return parse(f.read())
+
+    with mapped:
+        if not HAS_ORJSON:
+            return parse(mapped[:])
+        with memoryview(mapped) as view:
+            return parse(view)
@@ -1,13 +1,12 @@
 """Video assembler for Fast-Clip - main orchestration module."""
 
-import json
-import re
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
 
+from ._json import JSONDecodeError, parse_file
 from .uploader import ShotstackUploader
-from .timeline_builder import TimelineBuilder
+from .timeline_builder import RESOURCE_PLACEHOLDER_RE, TimelineBuilder
 from .shotstack_client import ShotstackClient
 
 
@@ -56,7 +55,9 @@ class VideoAssembler:
                 asset = clip.get("asset", {})
                 src = asset.get("src", "")
                 # Extract {{resources_dir/filename}} pattern
-                match = re.match(r"^\{\{([^}]+)\}\}$", src)
+                if not src.startswith("{{"):
+                    continue
+                match = RESOURCE_PLACEHOLDER_RE.match(src)
                 if match:
                     resources.append(match.group(1))
 
@@ -93,6 +94,7 @@ class VideoAssembler:
         script_path: Path,
         output_dir: Optional[Path] = None,
         verbose: bool = False,
+        script_data: Optional[dict] = None,
     ) -> AssemblyResult:
         """Assemble video from script.
 
@@ -100,6 +102,7 @@ class VideoAssembler:
             script_path: Path to JSON script
             output_dir: Where to save output (default: current directory)
             verbose: Print progress
+            script_data: Already parsed script (skips reading script_path)
 
         Returns:
             AssemblyResult with status
@@ -107,18 +110,18 @@ class VideoAssembler:
         script_path = Path(script_path)
 
         # Step 1: Load and validate script
-        if verbose:
-            print(f"📄 Loading script: {script_path}")
+        if script_data is None:
+            if verbose:
+                print(f"📄 Loading script: {script_path}")
 
-        try:
-            with open(script_path, "r", encoding="utf-8") as f:
-                script_data = json.load(f)
-        except FileNotFoundError:
-            return AssemblyResult(
-                success=False, error=f"Script not found: {script_path}"
-            )
-        except json.JSONDecodeError as e:
-            return AssemblyResult(success=False, error=f"Invalid JSON: {e}")
+            try:
+                script_data = parse_file(script_path)
+            except FileNotFoundError:
+                return AssemblyResult(
+                    success=False, error=f"Script not found: {script_path}"
+                )
+            except JSONDecodeError as e:
+                return AssemblyResult(success=False, error=f"Invalid JSON: {e}")
 
         # Step 2: Get resources directory
         script_dir = script_path.parent
@@ -412,22 +415,23 @@ class VideoAssembler:
         script_path: Path,
         output_dir: Optional[Path] = None,
         verbose: bool = False,
+        script_data: Optional[dict] = None,
     ) -> AssemblyResult:
         script_path = Path(script_path)
 
         # Step 1: Load and validate script
-        if verbose:
-            print(f"📄 Loading template script: {script_path}")
+        if script_data is None:
+            if verbose:
+                print(f"📄 Loading template script: {script_path}")
 
-        try:
-            with open(script_path, "r", encoding="utf-8") as f:
-                script_data = json.load(f)
-        except FileNotFoundError:
-            return AssemblyResult(
-                success=False, error=f"Script not found: {script_path}"
-            )
-        except json.JSONDecodeError as e:
-            return AssemblyResult(success=False, error=f"Invalid JSON: {e}")
+            try:
+                script_data = parse_file(script_path)
+            except FileNotFoundError:
+                return AssemblyResult(
+                    success=False, error=f"Script not found: {script_path}"
+                )
+            except JSONDecodeError as e:
+                return AssemblyResult(success=False, error=f"Invalid JSON: {e}")
 
         # Verify script structure and resources
         if verbose:
@@ -460,7 +464,6 @@ class VideoAssembler:
 
         script_dir = script_path.parent
         # Get resources_dir from template data
-        template_data = script_data.get("template", {})
         resources_dir_name = template_data.get(
             "resourcesDir", script_data.get("resourcesDir", ".")
         )
@@ -570,27 +573,24 @@ class VideoAssembler:
                             print(f"   ✓ Prepared merge for: {filename}")
 
         # Then, add merge entries for uploaded files from template placeholders
-        template_timeline = template_data.get("timeline", {})
-
-        # Helper to extract placeholders from timeline
-        def extract_placeholders(obj):
-            placeholders = set()
+        # Extract placeholders from timeline, walking it with an explicit
+        # stack instead of recursing and merging a set per node
+        placeholder_paths = set()
+        stack = [template_timeline]
+        while stack:
+            obj = stack.pop()
             if isinstance(obj, str):
                 if obj.startswith("{{") and obj.endswith("}}"):
-                    placeholders.add(obj[2:-2])
+                    placeholder_paths.add(obj[2:-2])
             elif isinstance(obj, dict):
-                for v in obj.values():
-                    placeholders.update(extract_placeholders(v))
+                stack.extend(obj.values())
             elif isinstance(obj, list):
-                for item in obj:
-                    placeholders.update(extract_placeholders(item))
-            return placeholders
-
-        placeholder_paths = extract_placeholders(template_timeline)
+                stack.extend(obj)
 
         # Add missing merge entries from placeholders
+        merge_finds = {m["find"] for m in merge_data}
         for path in placeholder_paths:
-            if not any(m.get("find") == path for m in merge_data):
+            if path not in merge_finds:
                 filename = path.split("/")[-1] if "/" in path else path
                 if filename in uploaded_files:
                     merge_data.append(
@@ -609,15 +609,17 @@ class VideoAssembler:
         # Deep copy timeline and replace placeholders with URLs
         import copy
 
-        timeline = copy.deepcopy(template_data.get("timeline", {}))
+        timeline = copy.deepcopy(template_timeline)
+
+        # First merge entry wins for a repeated find value
+        replacements: dict[str, str] = {}
+        for merge_item in merge_data:
+            replacements.setdefault(merge_item["find"], merge_item["replace"])
 
         def replace_placeholders(obj):
             if isinstance(obj, str):
                 if obj.startswith("{{") and obj.endswith("}}"):
-                    placeholder = obj[2:-2]
-                    for merge_item in merge_data:
-                        if merge_item["find"] == placeholder:
-                            return merge_item["replace"]
+                    return replacements.get(obj[2:-2], obj)
                 return obj
             elif isinstance(obj, dict):
                 return {k: replace_placeholders(v) for k, v in obj.items()}
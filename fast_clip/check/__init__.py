@@ -1,6 +1,6 @@
 """Fast-Clip Check Module - Script validation utilities."""
 
-from .checker import ScriptChecker, CheckResult, check_script
+from .checker import ScriptChecker, CheckResult, check_script, check_scripts_parallel
 from .validator import (
     SUPPORTED_FORMATS,
     SUPPORTED_RESOLUTIONS,
@@ -15,6 +15,7 @@ __all__ = [
     "ScriptChecker",
     "CheckResult",
     "check_script",
+    "check_scripts_parallel",
     "SUPPORTED_FORMATS",
     "SUPPORTED_RESOLUTIONS",
     "SUPPORTED_ORIENTATIONS",
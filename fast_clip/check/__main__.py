@@ -2,14 +2,29 @@
 
 import sys
 from pathlib import Path
+from typing import List
 
-from .checker import check_script
+from .checker import CheckResult, check_script, check_scripts_parallel
+
+
+def _print_errors(script_path: str, results: List[CheckResult]):
+    """Print the errors of a failed script in silent mode."""
+    print(f"\nScript validation failed for: {script_path}")
+    print("\nErrors found:")
+    for result in results:
+        if result.status == "ERROR":
+            print(f"  ✗ {result.field}: {result.message}")
+            if result.suggestion:
+                print(f"    → {result.suggestion}")
+    print(
+        f"\nUse -v flag for detailed output: python -m fast_clip.check -v {script_path}"
+    )
 
 
 def main():
     """Main entry point for check CLI."""
     verbose = False
-    script_path = None
+    script_paths: List[str] = []
 
     # Parse arguments
     for arg in sys.argv[1:]:
@@ -17,15 +32,15 @@ def main():
             verbose = True
         elif arg.startswith("-"):
             print(f"Unknown option: {arg}")
-            print("Usage: python -m fast_clip.check [-v] <script.json>")
-            print("       fast-clip-check [-v] <script.json>")
+            print("Usage: python -m fast_clip.check [-v] <script.json> [...]")
+            print("       fast-clip-check [-v] <script.json> [...]")
             sys.exit(2)
         else:
-            script_path = arg
+            script_paths.append(arg)
 
-    if not script_path:
-        print("Usage: python -m fast_clip.check [-v] <script.json>")
-        print("       fast-clip-check [-v] <script.json>")
+    if not script_paths:
+        print("Usage: python -m fast_clip.check [-v] <script.json> [...]")
+        print("       fast-clip-check [-v] <script.json> [...]")
         print("")
         print("Options:")
         print("  -v, --verbose    Show detailed check results")
@@ -33,25 +48,25 @@ def main():
         print("Examples:")
         print("  python -m fast_clip.check script.json          # Silent mode")
         print("  python -m fast_clip.check -v script.json       # Verbose mode")
+        print("  python -m fast_clip.check scripts/*.json       # Check many scripts")
         print("  fast-clip-check script.json                    # Using entry point")
         sys.exit(2)
 
-    is_valid, results = check_script(Path(script_path), verbose)
-
-    # In silent mode, show errors only
-    if not verbose and not is_valid:
-        print(f"\nScript validation failed for: {script_path}")
-        print("\nErrors found:")
-        for result in results:
-            if result.status == "ERROR":
-                print(f"  ✗ {result.field}: {result.message}")
-                if result.suggestion:
-                    print(f"    → {result.suggestion}")
-        print(
-            f"\nUse -v flag for detailed output: python -m fast_clip.check -v {script_path}"
-        )
-
-    sys.exit(0 if is_valid else 1)
+    paths = [Path(p) for p in script_paths]
+    if len(paths) > 1 and not verbose:
+        outcomes = check_scripts_parallel(check_script, paths)
+    else:
+        outcomes = [check_script(path, verbose) for path in paths]
+
+    all_valid = True
+    for script_path, (is_valid, results) in zip(script_paths, outcomes):
+        if not is_valid:
+            all_valid = False
+            # In silent mode, show errors only
+            if not verbose:
+                _print_errors(script_path, results)
+
+    sys.exit(0 if all_valid else 1)
 
 
 if __name__ == "__main__":
@@ -1,16 +1,28 @@
 """Script checker implementation."""
 
-import json
+import os
+import stat
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
+from collections import Counter
 from dataclasses import dataclass
 
+from .._json import JSONDecodeError, parse_file
 from .validator import (
     validate_script_config,
 )
 
 
-@dataclass
+# Result statuses
+_OK = "OK"
+_WARNING = "WARNING"
+_ERROR = "ERROR"
+
+_STATUS_ICONS = {_OK: "✓", _WARNING: "⚠"}
+
+
+@dataclass(slots=True, frozen=True)
 class CheckResult:
     """Result of a single check."""
 
@@ -20,6 +32,39 @@ class CheckResult:
     suggestion: Optional[str] = None
 
 
+def _scan_directory(directory: str) -> Optional[Dict[str, bool]]:
+    """Map entry names in a directory to whether each is a regular file.
+
+    One scandir() replaces a stat() per resource. Returns None if the
+    directory cannot be listed.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name: entry.is_file() for entry in it}
+    except OSError:
+        return None
+
+
+def _resource_is_file(
+    entries: Optional[Dict[str, bool]], directory: str, name: str
+) -> Optional[bool]:
+    """Return None if name is missing, else whether it is a regular file.
+
+    Names not found in the scan (nested paths, or a different case on a
+    case-insensitive filesystem) are confirmed with a single stat().
+    """
+    if entries is not None:
+        is_file = entries.get(name)
+        if is_file is not None:
+            return is_file
+
+    try:
+        st = os.stat(os.path.join(directory, name))
+    except (OSError, ValueError):
+        return None
+    return stat.S_ISREG(st.st_mode)
+
+
 class ScriptChecker:
     """Checker for Fast-Clip JSON scripts."""
 
@@ -31,71 +76,83 @@ class ScriptChecker:
         self.results: List[CheckResult] = []
         self.has_errors = False
         self.has_warnings = False
+        # Verbose output collected while check_all runs, written in one go
+        self._output: Optional[List[str]] = None
+
+    def _emit(self, text: str):
+        """Print text, or buffer it while check_all is running."""
+        if self._output is None:
+            print(text)
+        else:
+            self._output.append(text)
 
     def log(self, message: str):
         """Print message if verbose mode is enabled."""
         if self.verbose:
-            print(message)
+            self._emit(message)
 
     def add_result(
         self, field: str, status: str, message: str, suggestion: Optional[str] = None
     ):
         """Add check result and update error/warning flags."""
         self.results.append(CheckResult(field, status, message, suggestion))
-        if status == "ERROR":
+        if status == _ERROR:
             self.has_errors = True
-        elif status == "WARNING":
+        elif status == _WARNING:
             self.has_warnings = True
 
         if self.verbose:
-            icon = "✓" if status == "OK" else ("⚠" if status == "WARNING" else "✗")
-            print(f"  {icon} {field}: {message}")
+            icon = _STATUS_ICONS.get(status, "✗")
+            self._emit(f"  {icon} {field}: {message}")
             if suggestion:
-                print(f"    → {suggestion}")
+                self._emit(f"    → {suggestion}")
 
     def check_file_exists(self) -> bool:
         """Check if script file exists."""
         if not self.script_path.exists():
             self.add_result(
                 "File",
-                "ERROR",
+                _ERROR,
                 f"Script file not found: {self.script_path}",
                 "Check the file path and try again",
             )
             return False
 
-        self.add_result("File", "OK", f"Found: {self.script_path}")
+        self.add_result("File", _OK, f"Found: {self.script_path}")
         return True
 
     def check_json_valid(self) -> bool:
         """Check if file is valid JSON."""
         try:
-            with open(self.script_path, "r", encoding="utf-8") as f:
-                self.data = json.load(f)
-            self.add_result("JSON", "OK", "Valid JSON format")
+            self.data = parse_file(self.script_path)
+            self.add_result("JSON", _OK, "Valid JSON format")
             return True
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             self.add_result(
-                "JSON", "ERROR", f"Invalid JSON: {e}", "Fix JSON syntax errors"
+                "JSON", _ERROR, f"Invalid JSON: {e}", "Fix JSON syntax errors"
             )
             return False
-        except Exception as e:
+        except (OSError, UnicodeDecodeError) as e:
             self.add_result(
                 "JSON",
-                "ERROR",
+                _ERROR,
                 f"Cannot read file: {e}",
                 "Check file permissions and encoding",
             )
             return False
 
     def check_resources_exist(self):
-        """Check if resources directory and files exist."""
-        if not self.data:
+        """Check if resources directory and files exist.
+
+        Does nothing until the script has been parsed to an object.
+        """
+        if not isinstance(self.data, dict):
             return
 
+        template_data = self.data.get("template", {})
+
         # Handle template-based structure
         if "template" in self.data:
-            template_data = self.data.get("template", {})
             # Get resourcesDir from template or from top level (camelCase)
             resources_dir_name = template_data.get(
                 "resourcesDir", self.data.get("resourcesDir", ".")
@@ -106,29 +163,38 @@ class ScriptChecker:
             return
 
         resources_dir = self.script_dir / resources_dir_name
-        if not resources_dir.exists():
+        resources_dir_str = os.fspath(resources_dir)
+        # One stat() answers both "exists" and "is a directory"
+        try:
+            resources_mode: Optional[int] = os.stat(resources_dir_str).st_mode
+        except (OSError, ValueError):
+            resources_mode = None
+
+        if resources_mode is None:
             self.add_result(
                 "Resources Directory",
-                "ERROR",
+                _ERROR,
                 f"Directory not found: {resources_dir}",
-                f"Create directory '{self.data['resources_dir']}' or update 'resources_dir' field",
+                f"Create directory '{resources_dir_name}' or update 'resources_dir' field",
             )
             return
-        elif not resources_dir.is_dir():
+        elif not stat.S_ISDIR(resources_mode):
             self.add_result(
                 "Resources Directory",
-                "ERROR",
+                _ERROR,
                 f"Not a directory: {resources_dir}",
                 "Update 'resources_dir' to point to a valid directory",
             )
             return
         else:
-            self.add_result("Resources Directory", "OK", f"Found: {resources_dir}")
+            self.add_result("Resources Directory", _OK, f"Found: {resources_dir}")
+
+        # Check individual video files against a single directory listing
+        entries = _scan_directory(resources_dir_str)
+        add_result = self.add_result
 
-        # Check individual video files
         # Handle template structure
         if "template" in self.data:
-            template_data = self.data.get("template", {})
             timeline = template_data.get("timeline", {})
             tracks = timeline.get("tracks", [])
 
@@ -141,21 +207,25 @@ class ScriptChecker:
                         src = asset.get("src", "")
                         # Extract filename from {{placeholder}} format
                         if src.startswith("{{") and src.endswith("}}"):
-                            placeholder = src[2:-2]  # Remove {{ and }}
-                            if "/" in placeholder:
-                                filename = placeholder.split("/")[-1]
-                                resource_path = resources_dir / filename
-                                if not resource_path.exists():
-                                    self.add_result(
+                            # Remove {{ and }}, keep the last path component
+                            _, sep, filename = src[2:-2].rpartition("/")
+                            if sep:
+                                if (
+                                    _resource_is_file(
+                                        entries, resources_dir_str, filename
+                                    )
+                                    is None
+                                ):
+                                    add_result(
                                         f"Track[{track_count}].Clip[{j}].resource",
-                                        "WARNING",  # Changed to WARNING since these might be in merge
+                                        _WARNING,  # Changed to WARNING since these might be in merge
                                         f"File not found: {filename}",
                                         "Add file to resources directory or ensure it's in merge data",
                                     )
                                 else:
-                                    self.add_result(
+                                    add_result(
                                         f"Track[{track_count}].Clip[{j}].resource",
-                                        "OK",
+                                        _OK,
                                         f"Found: {filename}",
                                     )
                 track_count += 1
@@ -165,31 +235,49 @@ class ScriptChecker:
                 for i, item in enumerate(self.data["timeline"]):
                     if isinstance(item, dict) and "resource" in item:
                         resource = item["resource"]
-                        resource_path = resources_dir / resource
-                        if not resource_path.exists():
-                            self.add_result(
+                        is_file = _resource_is_file(
+                            entries, resources_dir_str, resource
+                        )
+                        if is_file is None:
+                            add_result(
                                 f"Timeline[{i}].resource",
-                                "ERROR",
+                                _ERROR,
                                 f"Video file not found: {resource}",
                                 f"Add file to '{resources_dir_name}' or update filename",
                             )
-                        elif not resource_path.is_file():
-                            self.add_result(
+                        elif not is_file:
+                            add_result(
                                 f"Timeline[{i}].resource",
-                                "ERROR",
+                                _ERROR,
                                 f"Not a file: {resource}",
                                 "Update resource to point to a valid file",
                             )
                         else:
-                            self.add_result(
-                                f"Timeline[{i}].resource", "OK", f"Found: {resource}"
+                            add_result(
+                                f"Timeline[{i}].resource", _OK, f"Found: {resource}"
                             )
 
     def check_all(self) -> bool:
-        """Run all checks. Return True if no errors."""
+        """Run all checks. Return True if no errors.
+
+        In verbose mode the report is buffered and written with a single
+        write() once the checks finish (or fail).
+        """
+        if not self.verbose:
+            return self._run_checks()
+
+        self._output = []
+        try:
+            return self._run_checks()
+        finally:
+            output, self._output = self._output, None
+            sys.stdout.write("\n".join(output) + "\n")
+
+    def _run_checks(self) -> bool:
+        """Run all checks for check_all."""
         if self.verbose:
-            print(f"\nChecking script: {self.script_path}\n")
-            print("=" * 60)
+            self._emit(f"\nChecking script: {self.script_path}\n")
+            self._emit("=" * 60)
 
         # Basic checks
         if not self.check_file_exists():
@@ -199,55 +287,54 @@ class ScriptChecker:
             return False
 
         if self.verbose:
-            print("\n" + "-" * 60)
-            print("Checking structure...")
-            print("-" * 60)
+            self._emit("\n" + "-" * 60)
+            self._emit("Checking structure...")
+            self._emit("-" * 60)
 
         # Validate script configuration
         validation_errors = validate_script_config(self.data or {})
+        add_result = self.add_result
         for status, message, suggestion in validation_errors:
             # Extract field name from message
-            if ":" in message:
-                field = message.split(":")[0]
+            field, sep, detail = message.partition(":")
+            if sep:
+                add_result(field, status, detail.strip(), suggestion)
             else:
-                field = "Script"
-            self.add_result(
-                field,
-                status,
-                message.split(":", 1)[-1].strip() if ":" in message else message,
-                suggestion,
-            )
+                add_result("Script", status, message, suggestion)
 
         if self.verbose:
-            print("\n" + "-" * 60)
-            print("Checking resources...")
-            print("-" * 60)
+            self._emit("\n" + "-" * 60)
+            self._emit("Checking resources...")
+            self._emit("-" * 60)
 
         # Check resources
         self.check_resources_exist()
 
         # Summary
         if self.verbose:
-            print("\n" + "=" * 60)
-            print("SUMMARY")
-            print("=" * 60)
+            self._emit("\n" + "=" * 60)
+            self._emit("SUMMARY")
+            self._emit("=" * 60)
 
-            errors = sum(1 for r in self.results if r.status == "ERROR")
-            warnings = sum(1 for r in self.results if r.status == "WARNING")
-            ok = sum(1 for r in self.results if r.status == "OK")
+            counts = Counter(r.status for r in self.results)
+            errors = counts[_ERROR]
+            warnings = counts[_WARNING]
+            ok = counts[_OK]
 
-            print(f"  ✓ Passed: {ok}")
-            print(f"  ⚠ Warnings: {warnings}")
-            print(f"  ✗ Errors: {errors}")
+            self._emit(f"  ✓ Passed: {ok}")
+            self._emit(f"  ⚠ Warnings: {warnings}")
+            self._emit(f"  ✗ Errors: {errors}")
 
             if errors > 0:
-                print(f"\n  Result: FAILED - Fix {errors} error(s) before processing")
+                self._emit(
+                    f"\n  Result: FAILED - Fix {errors} error(s) before processing"
+                )
                 return False
             elif warnings > 0:
-                print(f"\n  Result: PASSED with {warnings} warning(s)")
+                self._emit(f"\n  Result: PASSED with {warnings} warning(s)")
                 return True
             else:
-                print("\n  Result: PASSED - Ready to process!")
+                self._emit("\n  Result: PASSED - Ready to process!")
                 return True
 
         return not self.has_errors
@@ -268,3 +355,25 @@ def check_script(
     checker = ScriptChecker(script_path, verbose)
     is_valid = checker.check_all()
     return is_valid, checker.results
+
+
+def check_scripts_parallel(
+    check: Callable[[Path], Any], script_paths: List[Path]
+) -> List[Any]:
+    """Run check on every script in a pool of processes.
+
+    Scripts are independent, so a batch is spread over processes. Callers
+    keep verbose runs sequential, as their output would interleave.
+
+    Args:
+        check: Picklable function taking a script path
+        script_paths: Paths to JSON scripts
+
+    Returns:
+        Results of check, in the order of script_paths
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(len(script_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(check, script_paths))
@@ -3,7 +3,7 @@ Base validation classes and data structures.
 """
 
 from enum import Enum
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, Iterator
 from dataclasses import dataclass
 
 
@@ -15,7 +15,7 @@ class ValidationLevel(Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a validation operation."""
 
@@ -35,22 +35,44 @@ class ValidationReport:
     results: List[ValidationResult]
     total_errors: int
     total_warnings: int
+    # Data is too malformed for the remaining validators to say anything
+    fatal: bool = False
 
     @classmethod
-    def from_results(cls, results: List[ValidationResult]) -> "ValidationReport":
+    def from_results(
+        cls, results: List[ValidationResult], fatal: bool = False
+    ) -> "ValidationReport":
         """Create report from validation results."""
-        errors = [r for r in results if r.level == ValidationLevel.ERROR]
-        warnings = [r for r in results if r.level == ValidationLevel.WARNING]
-
-        is_valid = len(errors) == 0
+        error_level = ValidationLevel.ERROR
+        warning_level = ValidationLevel.WARNING
+
+        total_errors = 0
+        total_warnings = 0
+        for r in results:
+            level = r.level
+            if level is error_level:
+                total_errors += 1
+            elif level is warning_level:
+                total_warnings += 1
 
         return cls(
-            is_valid=is_valid,
+            is_valid=total_errors == 0,
             results=results,
-            total_errors=len(errors),
-            total_warnings=len(warnings),
+            total_errors=total_errors,
+            total_warnings=total_warnings,
+            fatal=fatal,
         )
 
+    def errors(self) -> Iterator[ValidationResult]:
+        """Iterate over error-level results."""
+        error_level = ValidationLevel.ERROR
+        return (r for r in self.results if r.level is error_level)
+
+    def warnings(self) -> Iterator[ValidationResult]:
+        """Iterate over warning-level results."""
+        warning_level = ValidationLevel.WARNING
+        return (r for r in self.results if r.level is warning_level)
+
 
 class BaseValidator:
     """Base class for all validators."""
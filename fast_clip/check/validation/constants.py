@@ -3,58 +3,62 @@ Constants for valid Shotstack field values.
 """
 
 # Valid transitions (case-insensitive)
-VALID_TRANSITIONS = {
-    "fade",
-    "fadefast",
-    "fadeslow",
-    "slideleft",
-    "slideright",
-    "slideup",
-    "slidedown",
-    "slideleftfast",
-    "sliderightfast",
-    "wipeleft",
-    "wiperight",
-    "wipeleftfast",
-    "wiperightfast",
-    "carouselleft",
-    "carouselright",
-    "carouselupfast",
-    "shuffletopright",
-    "shuffleleftbottom",
-    "reveal",
-    "revealfast",
-    "revealslow",
-    "zoom",
-    "zoomfast",
-    "zoomslow",
-}
+VALID_TRANSITIONS = frozenset(
+    {
+        "fade",
+        "fadefast",
+        "fadeslow",
+        "slideleft",
+        "slideright",
+        "slideup",
+        "slidedown",
+        "slideleftfast",
+        "sliderightfast",
+        "wipeleft",
+        "wiperight",
+        "wipeleftfast",
+        "wiperightfast",
+        "carouselleft",
+        "carouselright",
+        "carouselupfast",
+        "shuffletopright",
+        "shuffleleftbottom",
+        "reveal",
+        "revealfast",
+        "revealslow",
+        "zoom",
+        "zoomfast",
+        "zoomslow",
+    }
+)
 
 # Valid effects (case-insensitive)
-VALID_EFFECTS = {"zoomin", "zoomout", "kenburns"}
+VALID_EFFECTS = frozenset({"zoomin", "zoomout", "kenburns"})
 
 # Valid filters (case-insensitive)
-VALID_FILTERS = {
-    "boost",
-    "greyscale",
-    "contrast",
-    "muted",
-    "negative",
-    "darken",
-    "lighten",
-}
+VALID_FILTERS = frozenset(
+    {
+        "boost",
+        "greyscale",
+        "contrast",
+        "muted",
+        "negative",
+        "darken",
+        "lighten",
+    }
+)
 
 # Valid aspect ratios
-VALID_ASPECT_RATIOS = {"9:16", "16:9", "1:1", "4:5", "4:3"}
+VALID_ASPECT_RATIOS = frozenset({"9:16", "16:9", "1:1", "4:5", "4:3"})
 
 # Required top-level fields in Shotstack Template
-REQUIRED_TOP_LEVEL_FIELDS = {"template", "output", "merge"}
+REQUIRED_TOP_LEVEL_FIELDS = frozenset({"template", "output", "merge"})
 
 # Required fields in template.timeline
-REQUIRED_TIMELINE_FIELDS = {"tracks"}
+REQUIRED_TIMELINE_FIELDS = frozenset({"tracks"})
 
 # Valid asset types
-VALID_ASSET_TYPES = {"video", "image", "audio", "text", "title", "html"}
+VALID_ASSET_TYPES = frozenset({"video", "image", "audio", "text", "title", "html"})
 
 # Placeholder pattern for merge functionality
 PLACEHOLDER_PATTERN = r"\{\{([^}]+)\}\}"
@@ -71,6 +75,6 @@ VALIDATION_MESSAGES = {
     "invalid_json": "Invalid JSON syntax: {error}",
     "empty_template": "Template cannot be empty",
     "empty_merge": "Merge array cannot be empty",
-    "invalid_placeholder": "Invalid placeholder syntax: '{value}'. Use format: {{field}}",
+    "invalid_placeholder": "Invalid placeholder syntax: '{value}'. Use format: {{{{field}}}}",
     "placeholder_no_merge": "No merge entry found for placeholder: '{value}'",
 }
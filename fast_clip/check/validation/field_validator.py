@@ -15,6 +15,12 @@ from .constants import (
     VALIDATION_MESSAGES,
 )
 
+# Option lists for messages, joined once rather than per reported value
+_TRANSITION_OPTIONS = ", ".join(sorted(VALID_TRANSITIONS))
+_EFFECT_OPTIONS = ", ".join(sorted(VALID_EFFECTS))
+_FILTER_OPTIONS = ", ".join(sorted(VALID_FILTERS))
+_ASPECT_RATIO_OPTIONS = ", ".join(sorted(VALID_ASPECT_RATIOS))
+
 
 class FieldValidator(BaseValidator):
     """Validator for Shotstack SDK field compliance."""
@@ -122,7 +128,8 @@ class FieldValidator(BaseValidator):
                 field=field_path,
             )
 
-        if value.lower() not in VALID_TRANSITIONS:
+        # Scripts are normally lowercase already; only fold case on a miss
+        if value not in VALID_TRANSITIONS and value.lower() not in VALID_TRANSITIONS:
             level = (
                 ValidationLevel.WARNING
                 if not self.strict_mode
@@ -131,9 +138,9 @@ class FieldValidator(BaseValidator):
             return self._create_result(
                 status="WARNING" if not self.strict_mode else "ERROR",
                 message=VALIDATION_MESSAGES["invalid_transition"].format(
-                    value=value, options=", ".join(sorted(VALID_TRANSITIONS))
+                    value=value, options=_TRANSITION_OPTIONS
                 ),
-                suggestion=f"Use one of: {', '.join(sorted(VALID_TRANSITIONS))}",
+                suggestion=f"Use one of: {_TRANSITION_OPTIONS}",
                 level=level,
                 field=field_path,
             )
@@ -157,7 +164,7 @@ class FieldValidator(BaseValidator):
             )
             return results
 
-        if effect.lower() not in VALID_EFFECTS:
+        if effect not in VALID_EFFECTS and effect.lower() not in VALID_EFFECTS:
             level = (
                 ValidationLevel.WARNING
                 if not self.strict_mode
@@ -167,9 +174,9 @@ class FieldValidator(BaseValidator):
                 self._create_result(
                     status="WARNING" if not self.strict_mode else "ERROR",
                     message=VALIDATION_MESSAGES["invalid_effect"].format(
-                        value=effect, options=", ".join(sorted(VALID_EFFECTS))
+                        value=effect, options=_EFFECT_OPTIONS
                     ),
-                    suggestion=f"Use one of: {', '.join(sorted(VALID_EFFECTS))}",
+                    suggestion=f"Use one of: {_EFFECT_OPTIONS}",
                     level=level,
                     field=field_path,
                 )
@@ -194,7 +201,10 @@ class FieldValidator(BaseValidator):
             )
             return results
 
-        if filter_value.lower() not in VALID_FILTERS:
+        if (
+            filter_value not in VALID_FILTERS
+            and filter_value.lower() not in VALID_FILTERS
+        ):
             level = (
                 ValidationLevel.WARNING
                 if not self.strict_mode
@@ -204,9 +214,9 @@ class FieldValidator(BaseValidator):
                 self._create_result(
                     status="WARNING" if not self.strict_mode else "ERROR",
                     message=VALIDATION_MESSAGES["invalid_filter"].format(
-                        value=filter_value, options=", ".join(sorted(VALID_FILTERS))
+                        value=filter_value, options=_FILTER_OPTIONS
                     ),
-                    suggestion=f"Use one of: {', '.join(sorted(VALID_FILTERS))}",
+                    suggestion=f"Use one of: {_FILTER_OPTIONS}",
                     level=level,
                     field=field_path,
                 )
@@ -242,9 +252,9 @@ class FieldValidator(BaseValidator):
                     status="WARNING" if not self.strict_mode else "ERROR",
                     message=VALIDATION_MESSAGES["invalid_aspect_ratio"].format(
                         value=aspect_ratio,
-                        options=", ".join(sorted(VALID_ASPECT_RATIOS)),
+                        options=_ASPECT_RATIO_OPTIONS,
                     ),
-                    suggestion=f"Use one of: {', '.join(sorted(VALID_ASPECT_RATIOS))}",
+                    suggestion=f"Use one of: {_ASPECT_RATIO_OPTIONS}",
                     level=level,
                     field=field_path,
                 )
@@ -255,8 +265,8 @@ class FieldValidator(BaseValidator):
     def get_valid_values_summary(self) -> Dict[str, Set[str]]:
         """Get summary of all valid values for reference."""
         return {
-            "transitions": VALID_TRANSITIONS.copy(),
-            "effects": VALID_EFFECTS.copy(),
-            "filters": VALID_FILTERS.copy(),
-            "aspect_ratios": VALID_ASPECT_RATIOS.copy(),
+            "transitions": set(VALID_TRANSITIONS),
+            "effects": set(VALID_EFFECTS),
+            "filters": set(VALID_FILTERS),
+            "aspect_ratios": set(VALID_ASPECT_RATIOS),
         }
@@ -2,9 +2,10 @@
 File checker for media file availability validation.
 """
 
+import asyncio
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Set, Optional
+from typing import Dict, Any, FrozenSet, List, Set, Optional
 from urllib.parse import urlparse
 
 from .base import BaseValidator, ValidationResult, ValidationLevel, ValidationReport
@@ -25,8 +26,9 @@ class FileChecker(BaseValidator):
         self._validation_cache: Dict[str, ValidationResult] = {}
         self._max_workers = max_workers or min(8, (os.cpu_count() or 4) * 2)
         self._parallel_threshold = 5
-        self._base_dir_cache: Optional[Path] = None
-        self._content_dir_cache: Optional[Path] = None
+        self._base_dir_cache: Optional[str] = None
+        self._content_dir_cache: Optional[str] = None
+        self._dir_listings: Dict[str, Optional[FrozenSet[str]]] = {}
 
     def validate(self, data: Dict[str, Any]) -> ValidationReport:
         """Validate all media files in template."""
@@ -53,6 +55,31 @@ class FileChecker(BaseValidator):
 
         return ValidationReport.from_results(results)
 
+    async def validate_async(self, data: Dict[str, Any]) -> ValidationReport:
+        """Validate all media files in template, checking them concurrently.
+
+        Each existence check runs in a worker thread, at most max_workers
+        at a time, regardless of the parallel threshold. Results keep the
+        order of the paths in the template.
+        """
+        file_paths = self._extract_file_paths(data)
+
+        if not file_paths:
+            return ValidationReport.from_results([])
+
+        semaphore = asyncio.Semaphore(self._max_workers)
+
+        async def check(file_path: str) -> List[ValidationResult]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._check_file_accessibility, file_path
+                )
+
+        checked = await asyncio.gather(*(check(path) for path in file_paths))
+        return ValidationReport.from_results(
+            [result for results in checked for result in results]
+        )
+
     def _extract_file_paths(self, data: Dict[str, Any]) -> List[str]:
         """Extract all file paths from template data."""
         file_paths = []
@@ -88,7 +115,7 @@ class FileChecker(BaseValidator):
 
         resolved_path = self._resolve_path(file_path)
 
-        if resolved_path.exists():
+        if self._exists(resolved_path):
             result = ValidationResult(
                 status="OK",
                 level=ValidationLevel.INFO,
@@ -134,38 +161,79 @@ class FileChecker(BaseValidator):
 
         return results
 
-    def _resolve_path(self, file_path: str) -> Path:
-        """Resolve relative path based on script location."""
-        path = Path(file_path)
+    def _resolve_path(self, file_path: str) -> str:
+        """Resolve relative path based on script location.
 
-        if path.is_absolute():
-            return path
+        Works on plain strings; building Path objects for every media file
+        cost more than the lookups themselves.
+        """
+        if os.path.isabs(file_path):
+            # Keep Path's lexical normalisation in reported absolute paths
+            return os.fspath(Path(file_path))
 
         # Use cached base directory
         if self._base_dir_cache is None:
             if self.script_path:
                 if self.script_path.is_file():
-                    self._base_dir_cache = self.script_path.parent
+                    self._base_dir_cache = os.fspath(self.script_path.parent)
                 else:
-                    self._base_dir_cache = self.script_path
+                    self._base_dir_cache = os.fspath(self.script_path)
             else:
-                self._base_dir_cache = Path.cwd()
+                self._base_dir_cache = os.getcwd()
 
         base_dir = self._base_dir_cache
 
         # Try to resolve relative to the script's directory
-        resolved = base_dir / path
+        resolved = os.path.join(base_dir, file_path)
 
         # If not found, try resolving relative to a Content directory (cached)
-        if not resolved.exists():
+        if not self._exists(resolved):
             if self._content_dir_cache is None:
-                self._content_dir_cache = base_dir / "Content"
-            content_path = self._content_dir_cache / path
-            if content_path.exists():
+                self._content_dir_cache = os.path.join(base_dir, "Content")
+            content_path = os.path.join(self._content_dir_cache, file_path)
+            if self._exists(content_path):
                 resolved = content_path
 
-        return resolved.resolve()
+        return os.path.realpath(resolved)
+
+    def _list_dir(self, directory: str) -> Optional[FrozenSet[str]]:
+        """Return names of files and directories in directory, listed once.
+
+        Templates keep their media in a few directories, so one scandir()
+        per directory replaces a stat() per file. Returns None if the
+        directory cannot be listed.
+        """
+        try:
+            return self._dir_listings[directory]
+        except KeyError:
+            pass
+
+        try:
+            with os.scandir(directory) as it:
+                # is_file()/is_dir() follow symlinks, so broken links are left
+                # out just as Path.exists() would report them missing
+                names: Optional[FrozenSet[str]] = frozenset(
+                    entry.name for entry in it if entry.is_file() or entry.is_dir()
+                )
+        except OSError:
+            names = None
+
+        self._dir_listings[directory] = names
+        return names
+
+    def _exists(self, path: str) -> bool:
+        """Check existence against the cached listing of path's directory.
+
+        Misses are confirmed with a stat(), which also covers names that
+        differ only in case on case-insensitive filesystems.
+        """
+        directory, name = os.path.split(path)
+        names = self._list_dir(directory)
+        if names is not None and name in names:
+            return True
+        return os.path.exists(path)
 
     def clear_cache(self):
         """Clear file access cache."""
         self._validation_cache.clear()
+        self._dir_listings.clear()
@@ -3,9 +3,10 @@ JSON structure validator for Shotstack Template.
 """
 
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from pathlib import Path
 
+from ..._json import parse_file
 from .base import BaseValidator, ValidationResult, ValidationLevel, ValidationReport
 from .models import ShotstackTemplate
 from .constants import (
@@ -16,6 +17,24 @@ from .constants import (
 )
 import re
 
+_PLACEHOLDER_RE = re.compile(PLACEHOLDER_PATTERN)
+# bool is an int subclass and is accepted here, as before
+_NUMBER_TYPES = (int, float)
+_MISSING = object()
+
+
+def _iter_strings(obj: Any) -> Iterator[str]:
+    """Yield every string value nested in obj, in document order."""
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, str):
+            yield current
+        elif isinstance(current, dict):
+            stack.extend(reversed(current.values()))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+
 
 class JsonValidator(BaseValidator):
     """Validator for JSON structure and required fields."""
@@ -23,12 +42,21 @@ class JsonValidator(BaseValidator):
     def __init__(self, strict_mode: bool = False):
         super().__init__(strict_mode)
 
-    def validate(self, data: Dict[str, Any]) -> ValidationReport:
-        """Validate the entire JSON structure."""
+    def validate(
+        self, data: Dict[str, Any], from_parser: bool = False
+    ) -> ValidationReport:
+        """Validate the entire JSON structure.
+
+        Args:
+            data: Template data
+            from_parser: True if data was just decoded from JSON text, which
+                proves it serializable and skips the json.dumps round-trip
+        """
         results = []
 
         # Validate JSON syntax
-        results.extend(self._validate_json_syntax(data))
+        if not from_parser:
+            results.extend(self._validate_json_syntax(data))
 
         # Validate required top-level fields
         results.extend(self._validate_required_fields(data))
@@ -47,7 +75,10 @@ class JsonValidator(BaseValidator):
         if "output" in data:
             results.extend(self._validate_output_structure(data["output"]))
 
-        return ValidationReport.from_results(results)
+        # File and field checks read the template; without one there is
+        # nothing left for them to check
+        fatal = not (isinstance(data, dict) and isinstance(data.get("template"), dict))
+        return ValidationReport.from_results(results, fatal=fatal)
 
     def _validate_json_syntax(self, data: Any) -> List[ValidationResult]:
         """Validate that data is proper JSON-serializable."""
@@ -256,8 +287,9 @@ class JsonValidator(BaseValidator):
             )
 
         # Check for start and length
-        for field in ["start", "length"]:
-            if field not in clip:
+        for field in ("start", "length"):
+            value = clip.get(field, _MISSING)
+            if value is _MISSING:
                 results.append(
                     self._create_result(
                         status="ERROR",
@@ -266,7 +298,7 @@ class JsonValidator(BaseValidator):
                         field=f"template.timeline.tracks[{track_index}].clips[{clip_index}].{field}",
                     )
                 )
-            elif not isinstance(clip[field], (int, float)) or clip[field] < 0:
+            elif not isinstance(value, _NUMBER_TYPES) or value < 0:
                 results.append(
                     self._create_result(
                         status="ERROR",
@@ -357,28 +389,38 @@ class JsonValidator(BaseValidator):
         self, template: Dict[str, Any], merge: List[Dict[str, Any]]
     ) -> List[ValidationResult]:
         """Validate that all placeholders have corresponding merge entries."""
-        results = []
-
-        # Extract all placeholder patterns from template
-        template_str = json.dumps(template)
-        placeholders = re.findall(PLACEHOLDER_PATTERN, template_str)
+        results: List[ValidationResult] = []
+
+        # Extract all placeholder patterns from template strings. Scanning the
+        # values directly (rather than json.dumps output) keeps non-ASCII names
+        # unescaped and stops matches from spanning two adjacent strings.
+        # A template usually repeats the same placeholder in many clips; keys
+        # of a dict keep one of each in document order
+        placeholders: Dict[str, None] = {}
+        for value in _iter_strings(template):
+            if "{{" in value:
+                placeholders.update(dict.fromkeys(_PLACEHOLDER_RE.findall(value)))
 
         # Get all find values from merge array
         merge_find_values = {
             entry.get("find", "") for entry in merge if isinstance(entry, dict)
         }
 
-        # Check each placeholder
+        # Usually every placeholder is covered, which a single C-level subset
+        # test settles; otherwise report the missing ones in document order
+        if merge_find_values.issuperset(placeholders):
+            return results
+
+        level = (
+            ValidationLevel.WARNING if not self.strict_mode else ValidationLevel.ERROR
+        )
+        status = "WARNING" if not self.strict_mode else "ERROR"
+
         for placeholder in placeholders:
             if placeholder not in merge_find_values:
-                level = (
-                    ValidationLevel.WARNING
-                    if not self.strict_mode
-                    else ValidationLevel.ERROR
-                )
                 results.append(
                     self._create_result(
-                        status="WARNING" if not self.strict_mode else "ERROR",
+                        status=status,
                         message=VALIDATION_MESSAGES["placeholder_no_merge"].format(
                             value=placeholder
                         ),
@@ -418,7 +460,7 @@ class JsonValidator(BaseValidator):
             )
 
         if "fps" in output:
-            if not isinstance(output["fps"], (int, float)) or output["fps"] <= 0:
+            if not isinstance(output["fps"], _NUMBER_TYPES) or output["fps"] <= 0:
                 results.append(
                     self._create_result(
                         status="ERROR",
@@ -433,9 +475,8 @@ class JsonValidator(BaseValidator):
     def validate_file(self, file_path: Path) -> ValidationReport:
         """Validate a JSON file."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return self.validate(data)
+            data = parse_file(file_path)
+            return self.validate(data, from_parser=True)
         except FileNotFoundError:
             return ValidationReport.from_results(
                 [
@@ -1,23 +1,67 @@
 """Validation utilities for Fast-Clip scripts."""
 
+import functools
+import re
 from typing import Dict, List, Optional, Tuple, Any
 
 
-# Supported values
-SUPPORTED_FORMATS = {"mp4", "avi", "mov", "mkv"}
-SUPPORTED_RESOLUTIONS = {"2160p", "1440p", "1080p", "720p", "480p"}
-SUPPORTED_ORIENTATIONS = {"landscape", "portrait", "square"}
-VALID_EFFECTS = {
-    "fade_in",
-    "fade_out",
-    "slide_in",
-    "slide_out",
-    "cross_fade_in",
-    "cross_fade_out",
-}
-VALID_SLIDE_DIRECTIONS = {"left", "right", "top", "bottom"}
-
-
+# Supported values (lowercase, so lowered input needs a single lookup)
+SUPPORTED_FORMATS = frozenset({"mp4", "avi", "mov", "mkv"})
+SUPPORTED_RESOLUTIONS = frozenset({"2160p", "1440p", "1080p", "720p", "480p"})
+SUPPORTED_ORIENTATIONS = frozenset({"landscape", "portrait", "square"})
+VALID_EFFECTS = frozenset(
+    {
+        "fade_in",
+        "fade_out",
+        "slide_in",
+        "slide_out",
+        "cross_fade_in",
+        "cross_fade_out",
+    }
+)
+VALID_SLIDE_DIRECTIONS = frozenset({"left", "right", "top", "bottom"})
+
+# Suggestion texts, built once instead of per reported problem
+_SUPPORTED_FORMATS_HINT = ", ".join(sorted(SUPPORTED_FORMATS))
+_SUPPORTED_RESOLUTIONS_HINT = ", ".join(sorted(SUPPORTED_RESOLUTIONS))
+_SUPPORTED_ORIENTATIONS_HINT = ", ".join(sorted(SUPPORTED_ORIENTATIONS))
+_VALID_EFFECTS_HINT = ", ".join(sorted(VALID_EFFECTS))
+_VALID_SLIDE_DIRECTIONS_HINT = ", ".join(sorted(VALID_SLIDE_DIRECTIONS))
+
+# Marks an absent key, so one dict lookup tells missing from None
+_MISSING = object()
+
+# Video file extensions, matched case-insensitively
+_VIDEO_EXT_RE = re.compile(r"\.(?:mp4|avi|mov|mkv)\Z", re.IGNORECASE)
+_VIDEO_EXTS_HINT = "Add .mp4, .avi, .mov, or .mkv"
+
+# Top-level string fields: (field, hint if it must not be blank, name pattern)
+_STRING_FIELDS = (
+    ("name", "Provide a project name", None),
+    ("resources_dir", None, None),
+    ("result_file", None, _VIDEO_EXT_RE),
+)
+
+# Optional enum fields, compared case-insensitively: (field, noun, values, hint)
+_ENUM_FIELDS = (
+    ("output_format", "format", SUPPORTED_FORMATS, _SUPPORTED_FORMATS_HINT),
+    ("resolution", "resolution", SUPPORTED_RESOLUTIONS, _SUPPORTED_RESOLUTIONS_HINT),
+    (
+        "orientation",
+        "orientation",
+        SUPPORTED_ORIENTATIONS,
+        _SUPPORTED_ORIENTATIONS_HINT,
+    ),
+)
+
+# Upper bound on timeline items in legacy scripts
+MAX_TIMELINE_ITEMS = 10
+
+# Common shape of parse_time input (digits only), parsed without split()
+_TIME_RE = re.compile(r"(\d+):(\d+)(?::(\d+))?")
+
+
+@functools.lru_cache(maxsize=128)
 def parse_time(time_str: str) -> float:
     """Parse time string to seconds.
 
@@ -32,15 +76,21 @@ def parse_time(time_str: str) -> float:
     Raises:
         ValueError: If format is invalid
     """
-    parts = time_str.split(":")
-    if len(parts) == 2:  # MM:SS
-        minutes, seconds = map(int, parts)
-        return minutes * 60 + seconds
-    elif len(parts) == 3:  # HH:MM:SS
-        hours, minutes, seconds = map(int, parts)
-        return hours * 3600 + minutes * 60 + seconds
+    match = _TIME_RE.fullmatch(time_str)
+    if match is not None:
+        first, second, third = match.groups()
     else:
-        raise ValueError(f"Invalid time format: {time_str}. Use MM:SS or HH:MM:SS")
+        # Parts that int() accepts but the regex does not, such as " 1" or
+        # "-1", stay valid
+        parts = time_str.split(":")
+        if len(parts) not in (2, 3):
+            raise ValueError(f"Invalid time format: {time_str}. Use MM:SS or HH:MM:SS")
+        first, second = parts[0], parts[1]
+        third = parts[2] if len(parts) == 3 else None
+
+    if third is None:  # MM:SS
+        return int(first) * 60 + int(second)
+    return int(first) * 3600 + int(second) * 60 + int(third)  # HH:MM:SS
 
 
 def validate_timeline_item(
@@ -57,10 +107,20 @@ def validate_timeline_item(
     """
     errors: List[Tuple[str, str, Optional[str]]] = []
 
+    get = item.get
+    item_id = get("id", _MISSING)
+    resource = get("resource", _MISSING)
+    time_start = get("time_start", _MISSING)
+    time_end = get("time_end", _MISSING)
+
     # Check required fields
-    required = ["id", "resource", "time_start", "time_end"]
-    for field in required:
-        if field not in item:
+    for field, value in (
+        ("id", item_id),
+        ("resource", resource),
+        ("time_start", time_start),
+        ("time_end", time_end),
+    ):
+        if value is _MISSING:
             errors.append(
                 (
                     "ERROR",
@@ -70,8 +130,8 @@ def validate_timeline_item(
             )
 
     # Check id
-    if "id" in item:
-        if not isinstance(item["id"], int):
+    if item_id is not _MISSING:
+        if not isinstance(item_id, int):
             errors.append(
                 (
                     "ERROR",
@@ -79,18 +139,18 @@ def validate_timeline_item(
                     "Change to an integer",
                 )
             )
-        elif item["id"] != index + 1:
+        elif item_id != index + 1:
             errors.append(
                 (
                     "WARNING",
-                    f"timeline[{index}].id: Expected {index + 1}, got {item['id']}",
+                    f"timeline[{index}].id: Expected {index + 1}, got {item_id}",
                     f"Change id to {index + 1}",
                 )
             )
 
     # Check resource
-    if "resource" in item:
-        if not isinstance(item["resource"], str):
+    if resource is not _MISSING:
+        if not isinstance(resource, str):
             errors.append(
                 (
                     "ERROR",
@@ -98,7 +158,7 @@ def validate_timeline_item(
                     "Change to a string",
                 )
             )
-        elif not item["resource"].strip():
+        elif not resource.strip():
             errors.append(
                 (
                     "ERROR",
@@ -107,10 +167,10 @@ def validate_timeline_item(
                 )
             )
 
-    # Check time fields
-    for time_field in ["time_start", "time_end"]:
-        if time_field in item:
-            value = item[time_field]
+    # Check time fields, keeping parsed values for the consistency check
+    times: Dict[str, float] = {}
+    for time_field, value in (("time_start", time_start), ("time_end", time_end)):
+        if value is not _MISSING:
             if not isinstance(value, str):
                 errors.append(
                     (
@@ -121,7 +181,7 @@ def validate_timeline_item(
                 )
             else:
                 try:
-                    parse_time(value)
+                    times[time_field] = parse_time(value)
                 except ValueError:
                     errors.append(
                         (
@@ -132,28 +192,19 @@ def validate_timeline_item(
                     )
 
     # Check time consistency
-    if "time_start" in item and "time_end" in item:
-        try:
-            start = parse_time(item["time_start"])
-            end = parse_time(item["time_end"])
-            if start >= end:
-                errors.append(
-                    (
-                        "ERROR",
-                        f"timeline[{index}]: time_start >= time_end",
-                        "Ensure time_start < time_end",
-                    )
-                )
-        except ValueError:
-            pass
+    if len(times) == 2:
+        errors.extend(
+            _validate_time_range(times["time_start"], times["time_end"], index)
+        )
 
     # Check effects
-    for effect_field, duration_field in [
-        ("start_effect", "start_duration"),
-        ("end_effect", "end_duration"),
-    ]:
-        effect = item.get(effect_field)
-        duration = item.get(duration_field)
+    start_effect = get("start_effect")
+    end_effect = get("end_effect")
+    for effect_field, effect, duration_field in (
+        ("start_effect", start_effect, "start_duration"),
+        ("end_effect", end_effect, "end_duration"),
+    ):
+        duration = get(duration_field)
 
         if effect is not None:
             if effect not in VALID_EFFECTS:
@@ -161,7 +212,7 @@ def validate_timeline_item(
                     (
                         "WARNING",
                         f"timeline[{index}].{effect_field}: Unknown effect '{effect}'",
-                        f"Use: {', '.join(VALID_EFFECTS)}",
+                        f"Use: {_VALID_EFFECTS_HINT}",
                     )
                 )
 
@@ -184,27 +235,24 @@ def validate_timeline_item(
             )
 
     # Check slide_direction for slide effects
-    slide_direction = item.get("slide_direction")
+    slide_direction = get("slide_direction")
     if slide_direction is not None:
         if slide_direction not in VALID_SLIDE_DIRECTIONS:
             errors.append(
                 (
                     "ERROR",
                     f"timeline[{index}].slide_direction: Invalid direction '{slide_direction}'",
-                    f"Use: {', '.join(VALID_SLIDE_DIRECTIONS)}",
+                    f"Use: {_VALID_SLIDE_DIRECTIONS_HINT}",
                 )
             )
 
     # Validate slide effects require direction
-    start_effect = item.get("start_effect")
-    end_effect = item.get("end_effect")
-
     if start_effect == "slide_in" and not slide_direction:
         errors.append(
             (
                 "ERROR",
                 f"timeline[{index}].start_effect: slide_in requires slide_direction",
-                f"Add slide_direction: {', '.join(VALID_SLIDE_DIRECTIONS)}",
+                f"Add slide_direction: {_VALID_SLIDE_DIRECTIONS_HINT}",
             )
         )
 
@@ -213,13 +261,28 @@ def validate_timeline_item(
             (
                 "ERROR",
                 f"timeline[{index}].end_effect: slide_out requires slide_direction",
-                f"Add slide_direction: {', '.join(VALID_SLIDE_DIRECTIONS)}",
+                f"Add slide_direction: {_VALID_SLIDE_DIRECTIONS_HINT}",
             )
         )
 
     return errors
 
 
+def _validate_time_range(
+    start: float, end: float, index: int
+) -> List[Tuple[str, str, Optional[str]]]:
+    """Check that a timeline item starts before it ends."""
+    if start >= end:
+        return [
+            (
+                "ERROR",
+                f"timeline[{index}]: time_start >= time_end",
+                "Ensure time_start < time_end",
+            )
+        ]
+    return []
+
+
 def validate_script_config(
     data: Dict[str, Any],
 ) -> List[Tuple[str, str, Optional[str]]]:
@@ -280,64 +343,49 @@ def validate_script_config(
                     )
                 )
 
-    # Check name
-    if "name" in data:
-        if not isinstance(data["name"], str):
-            errors.append(
-                ("ERROR", "Field 'name': Expected string", "Change to a string")
-            )
-        elif not data["name"].strip():
-            errors.append(
-                ("ERROR", "Field 'name': Cannot be empty", "Provide a project name")
-            )
-
-    # Check resources_dir
-    if "resources_dir" in data:
-        if not isinstance(data["resources_dir"], str):
-            errors.append(
-                (
-                    "ERROR",
-                    "Field 'resources_dir': Expected string",
-                    "Change to a string",
-                )
-            )
-
-    # Check result_file
-    if "result_file" in data:
-        if not isinstance(data["result_file"], str):
+    # A script missing required fields is not worth walking further: the
+    # per-field findings would mostly be noise until the structure is fixed
+    if any(status == "ERROR" for status, _, _ in errors):
+        return errors
+
+    # Check string fields
+    for field, blank_hint, pattern in _STRING_FIELDS:
+        if field not in data:
+            continue
+        value = data[field]
+        if not isinstance(value, str):
             errors.append(
-                ("ERROR", "Field 'result_file': Expected string", "Change to a string")
+                ("ERROR", f"Field '{field}': Expected string", "Change to a string")
             )
-        elif not data["result_file"].endswith((".mp4", ".avi", ".mov", ".mkv")):
+        elif blank_hint is not None and not value.strip():
+            errors.append(("ERROR", f"Field '{field}': Cannot be empty", blank_hint))
+        elif pattern is not None and pattern.search(value) is None:
             errors.append(
-                (
-                    "WARNING",
-                    "Field 'result_file': No video extension",
-                    "Add .mp4, .avi, .mov, or .mkv",
-                )
+                ("WARNING", f"Field '{field}': No video extension", _VIDEO_EXTS_HINT)
             )
 
     # Check timeline
     if "timeline" in data:
-        if not isinstance(data["timeline"], list):
+        timeline = data["timeline"]
+        if not isinstance(timeline, list):
             errors.append(
                 ("ERROR", "Field 'timeline': Expected array", "Change to an array")
             )
-        elif len(data["timeline"]) == 0:
+        elif len(timeline) == 0:
             errors.append(
                 ("ERROR", "Field 'timeline': Cannot be empty", "Add at least one item")
             )
-        elif len(data["timeline"]) > 10:
+        elif len(timeline) > MAX_TIMELINE_ITEMS:
             errors.append(
                 (
                     "ERROR",
-                    f"Field 'timeline': Too many items ({len(data['timeline'])}, max 10)",
+                    f"Field 'timeline': Too many items ({len(timeline)}, max {MAX_TIMELINE_ITEMS})",
                     "Remove some items",
                 )
             )
         else:
             # Validate each timeline item
-            for i, item in enumerate(data["timeline"]):
+            for i, item in enumerate(timeline):
                 if not isinstance(item, dict):
                     errors.append(
                         (
@@ -351,36 +399,20 @@ def validate_script_config(
                     errors.extend(item_errors)
 
     # Check optional fields
-    if "output_format" in data and data["output_format"] is not None:
-        fmt = data["output_format"].lower()
-        if fmt not in SUPPORTED_FORMATS:
-            errors.append(
-                (
-                    "WARNING",
-                    f"Field 'output_format': Unsupported format '{fmt}'",
-                    f"Use: {', '.join(sorted(SUPPORTED_FORMATS))}",
-                )
-            )
-
-    if "resolution" in data and data["resolution"] is not None:
-        res = data["resolution"].lower()
-        if res not in SUPPORTED_RESOLUTIONS:
-            errors.append(
-                (
-                    "WARNING",
-                    f"Field 'resolution': Unsupported resolution '{res}'",
-                    f"Use: {', '.join(sorted(SUPPORTED_RESOLUTIONS))}",
-                )
-            )
-
-    if "orientation" in data and data["orientation"] is not None:
-        orient = data["orientation"].lower()
-        if orient not in SUPPORTED_ORIENTATIONS:
+    for field, noun, allowed, hint in _ENUM_FIELDS:
+        if data.get(field) is None:
+            continue
+        value = data[field]
+        # Skip the lowercase copy for values that already match
+        if isinstance(value, str) and value in allowed:
+            continue
+        value = value.lower()
+        if value not in allowed:
             errors.append(
                 (
                     "WARNING",
-                    f"Field 'orientation': Unsupported orientation '{orient}'",
-                    f"Use: {', '.join(sorted(SUPPORTED_ORIENTATIONS))}",
+                    f"Field '{field}': Unsupported {noun} '{value}'",
+                    f"Use: {hint}",
                 )
             )
 
@@ -0,0 +1,289 @@
+"""Fast-Clip Video Assembler CLI implementation."""
+
+import sys
+import os
+import stat
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+# Command-line flags: flag -> (option name, takes a value)
+_FLAGS = {
+    "-o": ("output", True),
+    "--output": ("output", True),
+    "-v": ("verbose", False),
+    "--verbose": ("verbose", False),
+    "--skip-validate": ("skip_validate", False),
+    "--strict": ("strict_mode", False),
+    "-h": ("help", False),
+    "--help": ("help", False),
+}
+
+
+@dataclass
+class _Options:
+    """Parsed command-line options."""
+
+    output: Optional[str] = None
+    verbose: bool = False
+    skip_validate: bool = False
+    strict_mode: bool = False
+
+
+_USAGE = (
+    "\n".join(
+        [
+            "Usage: python assemble.py <script.json> [options]",
+            "",
+            "Options:",
+            "  -o, --output <dir>    Output directory or file path",
+            "                        (default: <script_dir>/output/<name>.mp4)",
+            "  -v, --verbose         Verbose output",
+            "  --skip-validate        Skip validation (not recommended)",
+            "  --strict              Enable strict validation mode",
+            "  -h, --help            Show this help",
+            "",
+            "Environment:",
+            "  SHOTSTACK_API_KEY     Shotstack API key (required)",
+            "",
+            "Examples:",
+            "  python assemble.py script_video_01.json",
+            "  python assemble.py script_video_01.json -v",
+            "  python assemble.py script_video_01.json -o ./output -v",
+            "  python assemble.py script_video_01.json -o ./output/custom_name.mp4 -v",
+        ]
+    )
+    + "\n"
+)
+
+_API_KEY_HELP = (
+    "\n".join(
+        [
+            "❌ Error: SHOTSTACK_API_KEY not set",
+            "Please set your API key:",
+            "  1. Copy .env.example to .env",
+            "  2. Add your API key to .env",
+            "  3. Or set environment variable: export SHOTSTACK_API_KEY=your_key",
+            "",
+            "Get your API key from: https://shotstack.io/",
+        ]
+    )
+    + "\n"
+)
+
+# Script formats assemble.py can load
+_ACCEPTED_SUFFIXES = frozenset({".json"})
+
+# Known formats that need a conversion step, with the hint to show
+_REJECTED_SUFFIXES = {
+    ".md": (
+        "❌ Error: Markdown files are not supported directly.\n"
+        "   Please convert to JSON first:\n"
+        "   uv run python convert_script.py {script_path}"
+    ),
+}
+
+
+def print_usage():
+    """Print usage information."""
+    sys.stdout.write(_USAGE)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point.
+
+    Args:
+        argv: Command-line arguments without the program name
+            (default: sys.argv[1:])
+    """
+    # Parse arguments
+    args = sys.argv[1:] if argv is None else list(argv)
+
+    if not args or args[0] in ("-h", "--help"):
+        print_usage()
+        sys.exit(0)
+
+    # Load environment variables; .env is only read when the API key has
+    # not already been exported
+    if not os.getenv("SHOTSTACK_API_KEY"):
+        from dotenv import load_dotenv
+
+        load_dotenv()
+
+    script_path = Path(args[0])
+
+    options = _Options()
+
+    i = 1
+    while i < len(args):
+        spec = _FLAGS.get(args[i])
+        if spec is None:
+            print(f"Unknown option: {args[i]}")
+            print_usage()
+            sys.exit(1)
+
+        name, takes_value = spec
+        if name == "help":
+            print_usage()
+            sys.exit(0)
+        elif takes_value:
+            if i + 1 >= len(args):
+                print(f"Error: --{name} requires a directory")
+                sys.exit(1)
+            setattr(options, name, args[i + 1])
+            i += 2
+        else:
+            setattr(options, name, True)
+            i += 1
+
+    output_dir = Path(options.output) if options.output is not None else None
+    verbose = options.verbose
+    skip_validate = options.skip_validate
+    strict_mode = options.strict_mode
+
+    # Check API key
+    api_key = os.getenv("SHOTSTACK_API_KEY")
+    if not api_key:
+        sys.stdout.write(_API_KEY_HELP)
+        sys.exit(1)
+
+    # Check script exists; a single stat answers both questions. Like
+    # Path.exists(), any path that cannot be stat'ed counts as missing, and
+    # pipes are accepted as well as regular files
+    try:
+        script_stat = os.stat(script_path)
+    except (OSError, ValueError):
+        print(f"❌ Error: Script not found: {script_path}")
+        sys.exit(1)
+    if stat.S_ISDIR(script_stat.st_mode):
+        print(f"❌ Error: Not a file: {script_path}")
+        sys.exit(1)
+
+    # Check file format
+    suffix = script_path.suffix
+    if suffix in _REJECTED_SUFFIXES:
+        print(_REJECTED_SUFFIXES[suffix].format(script_path=script_path))
+        sys.exit(1)
+    elif suffix not in _ACCEPTED_SUFFIXES:
+        print(f"❌ Error: Unsupported file format '{suffix}'")
+        print(f"   Supported formats: {', '.join(sorted(_ACCEPTED_SUFFIXES))}")
+        sys.exit(1)
+
+    # Create assembler and run
+    header = ["🎬 Fast-Clip Video Assembler", f"   Script: {script_path}"]
+    if output_dir:
+        header.append(f"   Output: {output_dir}")
+    header.append("")
+    print(*header, sep="\n")
+
+    # Read and parse the script once; the parsed data is shared by the
+    # validators and the assembler
+    from ._json import parse_file
+
+    script_data = parse_file(script_path)
+
+    # Validate script before assembly (unless skipped)
+    if skip_validate:
+        print("⚠️  Skipping validation (not recommended)")
+        print("")
+    else:
+        print("🔍 Validating script...")
+
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        from itertools import chain
+
+        from .check.validation import (
+            JsonValidator,
+            FileChecker,
+            FieldValidator,
+        )
+
+        # Initialize validators
+        json_validator = JsonValidator(strict_mode=strict_mode)
+        file_checker = FileChecker(strict_mode=strict_mode, script_path=script_path)
+        field_validator = FieldValidator(strict_mode=strict_mode)
+
+        # Run validation; the validators share no state, so they run
+        # concurrently while FileChecker waits on the filesystem
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            json_future = executor.submit(
+                json_validator.validate, script_data, from_parser=True
+            )
+            file_future = executor.submit(
+                asyncio.run, file_checker.validate_async(script_data)
+            )
+            field_future = executor.submit(field_validator.validate, script_data)
+        json_report = json_future.result()
+        file_report = file_future.result()
+        field_report = field_future.result()
+
+        # Combine results and check for errors
+        total_errors = (
+            json_report.total_errors
+            + file_report.total_errors
+            + field_report.total_errors
+        )
+        total_warnings = (
+            json_report.total_warnings
+            + file_report.total_warnings
+            + field_report.total_warnings
+        )
+
+        if total_errors > 0:
+            print("❌ Validation FAILED - errors found:")
+            for issue in chain(
+                json_report.errors(), file_report.errors(), field_report.errors()
+            ):
+                print(f"  ✗ {issue.field or 'unknown'}: {issue.message}")
+                if issue.suggestion:
+                    print(f"    → {issue.suggestion}")
+            print("")
+            print("Fix errors before proceeding with assembly.")
+            sys.exit(1)
+
+        if total_warnings > 0:
+            print("⚠️  Validation passed with warnings:")
+            if verbose:
+                for issue in chain(
+                    json_report.warnings(),
+                    file_report.warnings(),
+                    field_report.warnings(),
+                ):
+                    print(f"  ! {issue.field or 'unknown'}: {issue.message}")
+                    if issue.suggestion:
+                        print(f"    → {issue.suggestion}")
+            print("")
+        else:
+            print("✅ Validation passed")
+        print("")
+
+    from .assembler import VideoAssembler
+
+    assembler = VideoAssembler(api_key)
+
+    if "template" in script_data:
+        print("📋 Using template + merge workflow")
+        result = assembler.assemble_with_template(
+            script_path, output_dir, verbose=verbose, script_data=script_data
+        )
+    else:
+        print("📋 Using direct workflow")
+        result = assembler.assemble(
+            script_path, output_dir, verbose=verbose, script_data=script_data
+        )
+
+    if result.success:
+        print("")
+        print("✅ Success!")
+        print(f"   Output: {result.output_path}")
+        print(f"   Render ID: {result.render_id}")
+        sys.exit(0)
+    else:
+        print("")
+        print(f"❌ Failed: {result.error}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
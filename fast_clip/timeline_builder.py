@@ -3,6 +3,9 @@
 import re
 from typing import Any
 
+# A string that is exactly one {{resources_dir/filename}} placeholder
+RESOURCE_PLACEHOLDER_RE = re.compile(r"^\{\{([^}]+)\}\}$")
+
 
 class TimelineBuilder:
     """Processes Shotstack-native JSON and replaces resource placeholders with URLs."""
@@ -26,8 +29,11 @@ class TimelineBuilder:
     def _resolve_placeholders(self, data: Any) -> Any:
         """Recursively resolve {{placeholder}} patterns in data."""
         if isinstance(data, str):
+            # Most strings are not placeholders; skip the regex for them
+            if not data.startswith("{{"):
+                return data
             # Match {{resources_dir/filename}} pattern
-            match = re.match(r"^\{\{([^}]+)\}\}$", data)
+            match = RESOURCE_PLACEHOLDER_RE.match(data)
             if match:
                 resource_path = match.group(1)
                 if resource_path in self.uploaded_urls:
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Unit tests for the JSON backend shim."""
+
+import json
+import math
+import os
+import threading
+
+import pytest
+
+from fast_clip import _json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run a test with orjson, and again with the stdlib fallback forced."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(_json, "HAS_ORJSON", False)
+    return request.param
+
+
+class TestJsonBackend:
+    """Test cases that every JSON backend must pass alike."""
+
+    def test_parse_file(self, backend, tmp_path):
+        """Test that a script file parses to plain Python objects."""
+        path = tmp_path / "script.json"
+        path.write_text('{"name": "Ролик", "timeline": [{"id": 1}]}', encoding="utf-8")
+
+        assert _json.parse_file(path) == {"name": "Ролик", "timeline": [{"id": 1}]}
+
+    def test_non_finite_numbers_are_accepted(self, backend, tmp_path):
+        """Test that NaN and Infinity parse as the stdlib json module allows."""
+        path = tmp_path / "script.json"
+        path.write_text('{"start": Infinity, "length": NaN}')
+
+        data = _json.parse_file(path)
+
+        assert data["start"] == math.inf
+        assert math.isnan(data["length"])
+
+    @pytest.mark.parametrize(
+        "number", [18446744073709551616, -9223372036854775809, 10**30]
+    )
+    def test_wide_integers_stay_exact(self, backend, tmp_path, number):
+        """Test that integers outside the 64-bit range are not read as floats."""
+        path = tmp_path / "script.json"
+        path.write_text(f'{{"id": {number}, "start": 1.5}}')
+
+        data = _json.parse_file(path)
+
+        assert data == {"id": number, "start": 1.5}
+        assert isinstance(data["id"], int)
+
+    def test_decode_error_keeps_position(self, backend, tmp_path):
+        """Test that syntax errors report their line and column."""
+        path = tmp_path / "script.json"
+        path.write_text('{\n  "a": 1,\n  "b": ]\n}')
+
+        with pytest.raises(_json.JSONDecodeError) as excinfo:
+            _json.parse_file(path)
+
+        assert (excinfo.value.lineno, excinfo.value.colno) == (3, 8)
+
+    def test_empty_file_is_invalid(self, backend, tmp_path):
+        """Test that an empty file raises JSONDecodeError."""
+        path = tmp_path / "script.json"
+        path.write_bytes(b"")
+
+        with pytest.raises(_json.JSONDecodeError):
+            _json.parse_file(path)
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs FIFOs")
+    def test_parse_fifo(self, backend, tmp_path):
+        """Test that a pipe, which cannot be memory-mapped, is read instead."""
+        path = tmp_path / "script.fifo"
+        os.mkfifo(path)
+
+        def write():
+            with open(path, "w") as f:
+                f.write('{"timeline": [{"id": 1}]}')
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            assert _json.parse_file(path) == {"timeline": [{"id": 1}]}
+        finally:
+            writer.join()
+
+    def test_dumps_matches_stdlib(self, backend):
+        """Test that dumps() writes what json.dumps(indent=2) would."""
+        data = {
+            "name": "Ролик",
+            "fps": 30,
+            "volume": 0.5,
+            "merge": [],
+            "x": None,
+            1: True,
+        }
+
+        assert _json.dumps(data) == json.dumps(
+            data, indent=2, ensure_ascii=False
+        ).encode("utf-8")
+
+    def test_dumps_wide_integer(self, backend):
+        """Test that integers outside the 64-bit range are written exactly."""
+        data = {"id": 2**64}
+
+        assert _json.dumps(data) == b'{\n  "id": 18446744073709551616\n}'
+
+    def test_dumps_small_floats_keep_their_value(self, backend):
+        """Test that small floats round-trip whichever notation is used."""
+        data = {"start": 1e-05, "length": 0.0001}
+
+        assert json.loads(_json.dumps(data)) == data
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Unit tests for validation modules."""
 
+import asyncio
 import pytest
 from pathlib import Path
 from typing import Dict, Any
@@ -11,7 +12,9 @@ from fast_clip.check.validation import (
     FieldValidator,
     ValidationLevel,
     ValidationReport,
+    ValidationResult,
 )
+from fast_clip.check import validator as script_validator
 
 
 class TestJsonValidator:
@@ -102,6 +105,22 @@ class TestJsonValidator:
         ]
         assert len(error_messages) > 0
 
+    def test_from_parser_skips_serialization_check(self):
+        """Test that parsed data skips the json.dumps round-trip."""
+        validator = JsonValidator()
+
+        data = {
+            "template": {"timeline": {"tracks": [{"clips": []}]}},
+            "output": {"format": "mp4", "extra": {1, 2}},
+            "merge": [{"find": "a", "replace": ""}],
+        }
+
+        default_report = validator.validate(data)
+        parsed_report = validator.validate(data, from_parser=True)
+
+        assert any("Invalid JSON" in r.message for r in default_report.results)
+        assert not any("Invalid JSON" in r.message for r in parsed_report.results)
+
     def test_placeholder_validation(self):
         """Test placeholder syntax validation."""
         validator = JsonValidator()
@@ -161,6 +180,41 @@ class TestJsonValidator:
         ]
         assert any("placeholder" in msg.lower() for msg in warning_messages)
 
+    def test_non_ascii_placeholder_matches_merge(self):
+        """Test that non-ASCII placeholder names are matched unescaped."""
+        validator = JsonValidator()
+
+        data = {
+            "template": {
+                "timeline": {
+                    "tracks": [
+                        {
+                            "clips": [
+                                {
+                                    "asset": {"type": "video", "src": "{{видео.mp4}}"},
+                                    "start": 0.0,
+                                    "length": 5.0,
+                                }
+                            ]
+                        }
+                    ]
+                }
+            },
+            "output": {"format": "mp4"},
+            "merge": [{"find": "видео.mp4", "replace": ""}],
+        }
+
+        report = validator.validate(data)
+        assert report.total_warnings == 0
+
+    def test_unusable_template_is_fatal(self):
+        """Test that a missing or non-dict template marks the report fatal."""
+        validator = JsonValidator()
+
+        assert validator.validate({"template": [{"src": "a.mp4"}]}).fatal
+        assert validator.validate({"output": {"format": "mp4"}}).fatal
+        assert not validator.validate({"template": {"timeline": {}}}).fatal
+
 
 class TestFileChecker:
     """Test cases for FileChecker."""
@@ -285,6 +339,47 @@ class TestFileChecker:
             if test_file.exists():
                 test_file.unlink()
 
+    def test_validate_async_matches_validate(self):
+        """Test that validate_async reports the same results as validate."""
+        test_file = Path("/tmp/async_test.mp4")
+        test_file.write_text("dummy content")
+
+        try:
+            data = {
+                "template": {
+                    "timeline": {
+                        "tracks": [
+                            {
+                                "clips": [
+                                    {
+                                        "asset": {"type": "video", "src": src},
+                                        "start": 0.0,
+                                        "length": 5.0,
+                                    }
+                                    for src in ("async_test.mp4", "missing.mp4")
+                                ]
+                            }
+                        ]
+                    }
+                },
+                "output": {"format": "mp4"},
+                "merge": [],
+            }
+
+            sync_report = FileChecker(script_path=Path("/tmp")).validate(data)
+            async_report = asyncio.run(
+                FileChecker(script_path=Path("/tmp")).validate_async(data)
+            )
+
+            assert [r.message for r in async_report.results] == [
+                r.message for r in sync_report.results
+            ]
+            assert async_report.total_warnings == 1
+
+        finally:
+            if test_file.exists():
+                test_file.unlink()
+
 
 class TestFieldValidator:
     """Test cases for FieldValidator."""
@@ -457,5 +552,97 @@ class TestFieldValidator:
         assert any("aspect ratio" in msg.lower() for msg in warning_messages)
 
 
+class TestValidationReport:
+    """Test cases for ValidationReport."""
+
+    def test_errors_and_warnings_iterators(self):
+        """Test that errors() and warnings() filter results by level."""
+        results = [
+            ValidationResult(status="ERROR", message="e1"),
+            ValidationResult(
+                status="WARNING", message="w1", level=ValidationLevel.WARNING
+            ),
+            ValidationResult(status="OK", message="ok", level=ValidationLevel.INFO),
+            ValidationResult(status="ERROR", message="e2"),
+        ]
+
+        report = ValidationReport.from_results(results)
+
+        assert [r.message for r in report.errors()] == ["e1", "e2"]
+        assert [r.message for r in report.warnings()] == ["w1"]
+
+
+class TestScriptConfig:
+    """Test cases for validate_script_config."""
+
+    def test_valid_script_reports_only_time_range(self):
+        """Test that a well-formed script is checked down to its time ranges."""
+        item = {
+            "id": 1,
+            "resource": "a.mp4",
+            "time_start": "00:05",
+            "time_end": "00:01",
+            "start_effect": "slide_in",
+            "start_duration": "1",
+            "slide_direction": "left",
+        }
+        errors = script_validator.validate_script_config(
+            {
+                "name": "demo",
+                "resources_dir": "res",
+                "result_file": "out.mp4",
+                "output_format": "MP4",
+                "timeline": [item],
+            }
+        )
+
+        assert [e[1] for e in errors] == ["timeline[0]: time_start >= time_end"]
+
+    def test_enum_fields_do_not_case_fold(self):
+        """Test that enum values only match after a plain lowercase."""
+        errors = script_validator.validate_script_config(
+            {
+                "name": "demo",
+                "resources_dir": "res",
+                "result_file": "out.mp4",
+                "orientation": "\u017fquare",  # LATIN SMALL LETTER LONG S
+                "timeline": [
+                    {
+                        "id": 1,
+                        "resource": "a.mp4",
+                        "time_start": "0:00",
+                        "time_end": "0:01",
+                    }
+                ],
+            }
+        )
+
+        assert [e[1] for e in errors] == [
+            "Field 'orientation': Unsupported orientation '\u017fquare'"
+        ]
+
+    def test_parse_time_accepts_int_syntax(self):
+        """Test that times parse as int() reads each part."""
+        assert script_validator.parse_time("01:30") == 90
+        assert script_validator.parse_time("1:00:05") == 3605
+        assert script_validator.parse_time(" 1:30") == 90
+        assert script_validator.parse_time("-1:30") == -30
+
+        for invalid in ("1:30:00:00", "90", "a:30", ""):
+            with pytest.raises(ValueError):
+                script_validator.parse_time(invalid)
+
+    def test_missing_required_fields_stop_validation(self):
+        """Test that only missing fields are reported when some are absent."""
+        errors = script_validator.validate_script_config(
+            {"name": 5, "timeline": [{"id": "x"}]}
+        )
+
+        assert [e[1] for e in errors] == [
+            "Required field 'resources_dir' is missing",
+            "Required field 'result_file' is missing",
+        ]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])